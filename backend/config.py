@@ -1,8 +1,8 @@
 import os
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from models import Base, UserProfile
 from supabase import create_client, Client
 
@@ -15,6 +15,13 @@ SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 DATABASE_URL = os.getenv("DATABASE_URL")
 SUPABASE_STORAGE_BUCKET = os.getenv("SUPABASE_STORAGE_BUCKET")
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
+
+# Per-process pool; each Lambda container serves one request at a time and
+# Supabase's pooler does the real multiplexing, so keep these small
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = 7
@@ -48,8 +55,20 @@ def get_supabase_storage():
     client = get_supabase_admin_client()
     return client.storage
 
+def _json_serializer(value) -> str:
+    """orjson-backed JSON/JSONB bind serializer (dialects expect str, not bytes)"""
+    return orjson.dumps(value).decode()
+
+
 if DATABASE_URL:
-    sync_engine = create_engine(DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"))
+    # psycopg2 engine (migrations/backfills): batch executemany into multi-row VALUES
+    sync_engine = create_engine(
+        DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"),
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads
+    )
     
     asyncpg_url = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
     
@@ -58,17 +77,32 @@ if DATABASE_URL:
     else:
         base_url = asyncpg_url
     
+    # Supabase's pooler runs in transaction mode, where a prepared statement may
+    # not exist on the next transaction's backend; SQLAlchemy's compiled cache
+    # still removes the Python-side cost
     asyncpg_url = f"{base_url}?prepared_statement_cache_size=0"
     
     async_engine = create_async_engine(
         asyncpg_url,
         echo=False,
-        pool_pre_ping=False, 
-        pool_size=5,
-        max_overflow=0
+        # A thawed Lambda container can hold sockets the pooler already closed;
+        # ping on checkout instead of failing the request with a dead connection
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        # Reuse the most recently returned connection so the rest sit idle
+        # long enough for the pooler to reclaim them
+        pool_use_lifo=True,
+        pool_recycle=DB_POOL_RECYCLE,
+        insertmanyvalues_page_size=1000,
+        # Route queries vary by optional filters; keep every variant's compiled
+        # form cached instead of the default 500 entries
+        query_cache_size=1200,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads
     )
 
-    AsyncSessionLocal = sessionmaker(
+    AsyncSessionLocal = async_sessionmaker(
         bind=async_engine,
         class_=AsyncSession,
         expire_on_commit=False
@@ -97,3 +131,11 @@ def get_sync_engine():
 
 ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")
 DEBUG = ENVIRONMENT == "dev"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "INFO").upper()
+
+# Comma-separated list of browser origins allowed to call the API
+CORS_ALLOW_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
@@ -3,12 +3,14 @@ RBAC dependencies for FastAPI routes
 Role-based access control implemented as dependencies that run after authentication
 """
 from fastapi import Depends, HTTPException, status, Request
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List
 import logging
 
 logger = logging.getLogger(__name__)
 
-RESOURCES_FOR_ROLES = {
+_RAW_RESOURCES_FOR_ROLES = {
     'admin': {
         'admin': ['read', 'write', 'delete'], 
         'users': ['read', 'write', 'delete'], 
@@ -51,88 +53,105 @@ RESOURCES_FOR_ROLES = {
     }
 }
 
+# Read-only view of the table above: role -> resource -> frozenset of actions
+RESOURCES_FOR_ROLES = MappingProxyType({
+    role: MappingProxyType({resource: frozenset(actions) for resource, actions in resources.items()})
+    for role, resources in _RAW_RESOURCES_FOR_ROLES.items()
+})
+
+_USERS_SUBRESOURCES = {
+    'me': 'users/me',
+    'profile': 'users/profiles',
+    'profiles': 'users/profiles',
+    'vendor-profile': 'users/vendor-profiles',
+    'vendor-profiles': 'users/vendor-profiles',
+    'supplier-profile': 'users/supplier-profiles',
+    'supplier-profiles': 'users/supplier-profiles',
+    'reviews': 'users/reviews',
+}
+
+def _normalize_admin(segments: List[str]) -> str:
+    if len(segments) >= 2:
+        if segments[1] == 'categories':
+            return 'categories'
+        return f'admin/{segments[1]}'
+    return 'admin'
+
+def _normalize_users(segments: List[str]) -> str:
+    if len(segments) >= 2:
+        return _USERS_SUBRESOURCES.get(segments[1], 'users')
+    return 'users'
+
+def _normalize_products(segments: List[str]) -> str:
+    if 'bulk-pricing' in segments[1:]:
+        return 'products/bulk-pricing'
+    return 'products'
+
+# Top-level segments that map to something other than themselves
+_PREFIX_HANDLERS = {
+    'admin': _normalize_admin,
+    'users': _normalize_users,
+    'products': _normalize_products,
+}
+
 def normalize_path(path: str) -> str:
-    """Normalize request path for RBAC checking"""    
+    """Normalize request path for RBAC checking"""
     if path.startswith('/'):
         path = path[1:]
 
     segments = path.split('/')
-    
-    if len(segments) == 0:
-        return path
-    
-    if segments[0] == 'admin':
-        if len(segments) >= 2:
-            if segments[1] == 'categories':
-                return 'categories'
-            return f'admin/{segments[1]}'
-        return 'admin'
-    
-    elif segments[0] == 'users':
-        if len(segments) >= 2:
-            if segments[1] == 'me':
-                return 'users/me'
-            elif segments[1] == 'profile' or segments[1] == 'profiles':
-                return 'users/profiles'
-            elif segments[1] == 'vendor-profile' or segments[1] == 'vendor-profiles':
-                return 'users/vendor-profiles'
-            elif segments[1] == 'supplier-profile' or segments[1] == 'supplier-profiles':
-                return 'users/supplier-profiles'
-            elif segments[1] == 'reviews':
-                return 'users/reviews'
-        return 'users'
-    
-    elif segments[0] == 'products':
-        if len(segments) >= 2:
-            if segments[1] == 'bulk-pricing' or 'bulk-pricing' in segments:
-                return 'products/bulk-pricing'
-        return 'products'
-    
-    elif segments[0] == 'categories':
-        return 'categories'
-    
-    elif segments[0] == 'analytics':
-        return 'analytics'
-    
-    elif segments[0] == 'settings':
-        return 'settings'
-    
-    elif segments[0] == 'reports':
-        return 'reports'
-    
-    return segments[0]
+    handler = _PREFIX_HANDLERS.get(segments[0])
+    return handler(segments) if handler else segments[0]
+
+_METHOD_ACTIONS = {
+    'GET': 'read',
+    'POST': 'write',
+    'PUT': 'write',
+    'PATCH': 'write',
+    'DELETE': 'delete',
+}
 
 def translate_method_to_action(method: str) -> str:
     """Map HTTP methods to RBAC actions"""
-    method_permission_mapping = {
-        'GET': 'read',
-        'POST': 'write',
-        'PUT': 'write',
-        'PATCH': 'write',
-        'DELETE': 'delete',
-    }
-    return method_permission_mapping.get(method.upper(), 'read')
+    return _METHOD_ACTIONS.get(method) or _METHOD_ACTIONS.get(method.upper(), 'read')
+
+_KNOWN_RESOURCES = frozenset(
+    resource for resources in RESOURCES_FOR_ROLES.values() for resource in resources
+)
+
+def _expand_permissions() -> frozenset:
+    """Flatten RESOURCES_FOR_ROLES into (role, resource, action) triples.
+
+    Resources a role does not list inherit the actions of their parent resource
+    (e.g. 'users/me' for admin falls back to 'users'), so that fallback is baked
+    in here for every resource name known to any role.
+    """
+    perms = set()
+    for role, resources in RESOURCES_FOR_ROLES.items():
+        for resource in _KNOWN_RESOURCES:
+            actions = resources.get(resource)
+            if actions is None:
+                actions = resources.get(resource.split('/')[0], ())
+            perms.update((role, resource, action) for action in actions)
+    return frozenset(perms)
+
+_PERMS = _expand_permissions()
 
 def has_permission(user_role: str, resource_name: str, required_permission: str) -> bool:
     """Check if user role has permission for the resource and action"""
-    if user_role not in RESOURCES_FOR_ROLES:
-        return False
-    
-    user_permissions = RESOURCES_FOR_ROLES[user_role]
-    
-    if resource_name in user_permissions:
-        return required_permission in user_permissions[resource_name]
-    
-    parent_resource = resource_name.split('/')[0] if '/' in resource_name else resource_name
-    if parent_resource in user_permissions:
-        return required_permission in user_permissions[parent_resource]
-    
-    return False
+    if resource_name not in _KNOWN_RESOURCES:
+        # Unlisted sub-resource (e.g. 'admin/stats'): only the parent can grant it
+        resource_name = resource_name.split('/')[0]
+    return (user_role, resource_name, required_permission) in _PERMS
 
+@lru_cache(maxsize=None)
 def require_permission(resource: str = None, permission: str = None):
     """
     Create an RBAC dependency that checks permissions
     
+    Memoized so every (resource, permission) pair maps to one callable, which
+    lets FastAPI de-duplicate the dependency within a request.
+    
     Args:
         resource: Specific resource name (auto-detected if not provided)
         permission: Specific permission (auto-detected if not provided)
@@ -140,38 +159,36 @@ def require_permission(resource: str = None, permission: str = None):
     def check_rbac(request: Request):
         """RBAC dependency function"""
         try:
-            current_user = getattr(request.state, 'current_user', None)
-            if not current_user:
+            state = request.state
+            if not getattr(state, 'current_user', None):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Authentication required"
                 )
 
-            user_role = 'user'  # default fallback to match registration default
-            if isinstance(current_user, dict) and 'role' in current_user:
-                user_role = current_user['role']
-            else:
-                user_role = getattr(current_user, 'role', 'user')
+            # Set by get_current_user; 'user' matches the registration default
+            user_role = getattr(state, 'user_role', 'user')
 
-            resource_name = resource or normalize_path(str(request.url.path))
-            required_permission = permission or translate_method_to_action(request.method)
-            
-            logger.info(f"RBAC Check - User: {user_role}, Resource: {resource_name}, Permission: {required_permission}")
+            # Read the raw ASGI scope rather than building a URL object per request
+            resource_name = resource or normalize_path(request.scope["path"])
+            required_permission = permission or translate_method_to_action(request.scope["method"])
 
             if not has_permission(user_role, resource_name, required_permission):
-                logger.warning(f"Access denied - User: {user_role}, Resource: {resource_name}, Permission: {required_permission}")
+                logger.warning(
+                    "Access denied - User: %s, Resource: %s, Permission: %s",
+                    user_role, resource_name, required_permission
+                )
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"Access denied. {user_role.title()} role does not have {required_permission} permission for {resource_name}"
                 )
             
-            logger.info(f"Access granted - User: {user_role}, Resource: {resource_name}, Permission: {required_permission}")
             return True
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"RBAC dependency error: {str(e)}")
+            logger.error("RBAC dependency error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Authorization check failed"
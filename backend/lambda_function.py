@@ -1,8 +1,6 @@
-import json
-from mangum import Mangum
-from main import app
-
-handler = Mangum(app, lifespan="off")
+# Imported at module load so the app is built during the init phase, which
+# provisioned concurrency and SnapStart can run ahead of the first request
+from main import handler
 
 def lambda_handler(event, context):
-    return handler(event, context)
\ No newline at end of file
+    return handler(event, context)
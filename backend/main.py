@@ -1,14 +1,18 @@
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi import Request, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from config import get_db, get_supabase_client, get_supabase_admin_client
+from sqlalchemy import select, update, text
+from config import get_db, get_supabase_client, get_supabase_admin_client, LOG_LEVEL, CORS_ALLOW_ORIGINS
 from models import UserProfile
 from routers.users.schemas import UserRoleUpdateRequest, UserRoleUpdateResponse
+from typing import Optional, Tuple
 from uuid import UUID
+import asyncio
+import hashlib
+import logging
 import os
 
 from routers.auth.auth import router as auth_router
@@ -22,6 +26,18 @@ from routers.suppliers.suppliers import router as suppliers_router
 ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")
 IS_PRODUCTION = ENVIRONMENT == "prod"
 
+logging.getLogger().setLevel(LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+__all__ = ["app", "handler"]
+
+# Schema migrations run out-of-band via scripts/migrate.py. Only local development
+# may opt into applying them in-process with MIGRATION_MODE=sync.
+MIGRATION_MODE = os.getenv("MIGRATION_MODE", "skip")
+if MIGRATION_MODE == "sync" and not IS_PRODUCTION:
+    from scripts.migrate import upgrade as run_migrations
+    run_migrations()
+
 app = FastAPI(
     title="UstaadCart API",
     description="A comprehensive API for UstaadCart, a platform for suppliers and vendors to connect.",
@@ -30,6 +46,7 @@ app = FastAPI(
     docs_url="/apidocs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     servers=[
         {"url": "https://your-aws-api.execute-api.region.amazonaws.com/Prod", "description": "Production Server"},
         {"url": "http://localhost:8000", "description": "Local Development Server"},
@@ -39,10 +56,11 @@ app = FastAPI(
  
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  
+    allow_origins=CORS_ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 app.include_router(auth_router)
@@ -54,6 +72,38 @@ app.include_router(payments_router)
 app.include_router(suppliers_router)
 
 
+async def _update_supabase_role(user_id: str, new_role: str) -> Tuple[bool, Optional[str]]:
+    """Update the role in Supabase user metadata; returns (updated, error message)"""
+    try:
+        supabase_admin = get_supabase_admin_client()
+        logger.debug("Attempting to update user metadata for user: %s", user_id)
+        
+        # The Supabase client is synchronous, so run it off the event loop.
+        # Updating user metadata updates the JWT claims on next login.
+        supabase_response = await asyncio.to_thread(
+            supabase_admin.auth.admin.update_user_by_id,
+            uid=user_id,
+            attributes={
+                "user_metadata": {"role": new_role},
+            }
+        )
+        
+        if supabase_response.user:
+            logger.debug("Successfully updated Supabase metadata for user: %s", user_id)
+            return True, None
+        
+        logger.debug("Supabase update returned no user object for: %s", user_id)
+        return False, "No user object returned from Supabase"
+        
+    except Exception as supabase_error:
+        # Log the detailed error but don't fail the request
+        logger.warning(
+            "Failed to update Supabase metadata (%s): %s",
+            type(supabase_error).__name__, supabase_error
+        )
+        return False, str(supabase_error)
+
+
 @app.put("/temp/users/{user_id}/change-role", response_model=UserRoleUpdateResponse)
 async def temp_change_user_role(
     user_id: str,
@@ -89,55 +139,40 @@ async def temp_change_user_role(
                 detail="Invalid user ID format. Must be a valid UUID."
             )
         
-        # Find user profile in database
-        result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_uuid))
-        user_profile = result.scalar_one_or_none()
+        # Update the role and read back the previous one in a single round trip.
+        # user_profiles.user_id is UNIQUE, so both lookups are index scans.
+        previous = (
+            select(UserProfile.id, UserProfile.role.label("old_role"))
+            .where(UserProfile.user_id == user_uuid)
+            .with_for_update()
+            .subquery()
+        )
+        result = await db.execute(
+            update(UserProfile)
+            .where(UserProfile.id == previous.c.id)
+            .values(role=role_update.new_role)
+            .returning(previous.c.old_role)
+            .execution_options(synchronize_session=False)
+        )
+        old_role = result.scalar_one_or_none()
         
-        if not user_profile:
+        if old_role is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with ID {user_id} not found in database"
             )
         
-        # Store old role for response
-        old_role = user_profile.role
-        
-        # Update role in database
-        user_profile.role = role_update.new_role
-        await db.commit()
-        await db.refresh(user_profile)
-        
-        # Update Supabase user metadata
-        supabase_updated = False
-        supabase_error_message = None
+        # Push the role into Supabase metadata while the DB transaction commits
+        supabase_task = asyncio.create_task(_update_supabase_role(user_id, role_update.new_role))
         try:
-            supabase_admin = get_supabase_admin_client()
-            
-            # Debug: Check if we're using the admin client correctly
-            print(f"Attempting to update user metadata for user: {user_id}")
-            print(f"Using service role key: {get_supabase_admin_client().supabase_key[:10]}...")
-            
-            # Try to update user metadata - this updates the JWT claims on next login
-            supabase_response = supabase_admin.auth.admin.update_user_by_id(
-                uid=user_id,
-                attributes={
-                    "user_metadata": {"role": role_update.new_role},
-                }
-            )
-            
-            if supabase_response.user:
-                supabase_updated = True
-                print(f"Successfully updated Supabase metadata for user: {user_id}")
-            else:
-                print(f"Supabase update returned no user object for: {user_id}")
-                supabase_error_message = "No user object returned from Supabase"
-            
-        except Exception as supabase_error:
-            supabase_error_message = str(supabase_error)
-            # Log the detailed error but don't fail the request
-            print(f"Warning: Failed to update Supabase metadata: {supabase_error_message}")
-            print(f"Error type: {type(supabase_error).__name__}")
-            supabase_updated = False
+            await db.commit()
+        except Exception:
+            # The database keeps the old role, so put Supabase back to match it
+            supabase_updated, _ = await supabase_task
+            if supabase_updated:
+                await _update_supabase_role(user_id, old_role)
+            raise
+        supabase_updated, supabase_error_message = await supabase_task
         
         return UserRoleUpdateResponse(
             success=True,
@@ -159,12 +194,37 @@ async def temp_change_user_role(
             detail=f"An unexpected error occurred while changing user role: {str(e)}"
         )
 
-@app.get("/docs", include_in_schema=False)
-async def api_documentation(request: Request):
-    openapi_url = "/Prod/openapi.json" if IS_PRODUCTION else "/openapi.json"
+_MIGRATION_HEAD: Optional[str] = None
+
+
+async def _get_migration_status(db: AsyncSession) -> dict:
+    """Compare the database revision against the bundled head"""
+    global _MIGRATION_HEAD
+    # Migrations run out-of-band after deploy, so read the single-row
+    # alembic_version on every call; only the bundled head is fixed per process
+    try:
+        result = await db.execute(text("SELECT version_num FROM alembic_version"))
+        current = result.scalar_one_or_none()
+    except Exception as e:
+        logger.warning("Could not read alembic_version: %s", e)
+        return {"current": None, "head": None, "up_to_date": False}
     
-    return HTMLResponse(
-        f"""
+    if _MIGRATION_HEAD is None:
+        from scripts.migrate import get_head_revision
+        _MIGRATION_HEAD = get_head_revision()
+    return {"current": current, "head": _MIGRATION_HEAD, "up_to_date": current == _MIGRATION_HEAD}
+
+
+@app.get("/healthz", include_in_schema=False)
+async def healthz(db: AsyncSession = Depends(get_db)):
+    return {"app": "ok", "migration": await _get_migration_status(db)}
+
+
+_OPENAPI_URL = "/Prod/openapi.json" if IS_PRODUCTION else "/openapi.json"
+
+# The landing and docs pages never change at runtime, so they are encoded once
+# at import and served with an ETag that lets clients revalidate for free.
+_DOCS_BYTES = f"""
 <!doctype html>
 <html lang="en">
   <head>
@@ -178,19 +238,15 @@ async def api_documentation(request: Request):
   <body>
 
     <elements-api
-      apiDescriptionUrl="{openapi_url}"
+      apiDescriptionUrl="{_OPENAPI_URL}"
       router="hash"
       theme="dark"
     />
 
   </body>
-</html>"""
-    )
+</html>""".encode()
 
-@app.get("/", response_class=HTMLResponse)
-def home():
-    """This is the first and default route for the UstaadCart Backend"""
-    return """
+_HOME_BYTES = """
     <html>
       <head>
         <title>UstaadCart API</title>
@@ -216,11 +272,41 @@ def home():
           <hr>
           <li><a href="http://localhost:3000">Frontend Website</a></li>
           <hr>
-          <h2>Blogging Platform API - Built with FastAPI & Supabase</h2>
+          <h2>UstaadCart API - Built with FastAPI & Supabase</h2>
         </ul>
       </body>
     </html>
-    """
+    """.encode()
+
+def _static_headers(body: bytes) -> dict:
+    return {
+        "ETag": f'"{hashlib.sha1(body).hexdigest()}"',
+        "Cache-Control": "public, max-age=3600",
+    }
+
+
+_DOCS_HEADERS = _static_headers(_DOCS_BYTES)
+_HOME_HEADERS = _static_headers(_HOME_BYTES)
+
+
+def _static_html(request: Request, body: bytes, headers: dict) -> Response:
+    # A fresh Response per request: middleware (CORS) appends to a response's
+    # header list in place, so a shared instance would grow on every hit.
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+@app.get("/docs", include_in_schema=False)
+async def api_documentation(request: Request):
+    return _static_html(request, _DOCS_BYTES, _DOCS_HEADERS)
+
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request):
+    """This is the first and default route for the UstaadCart Backend"""
+    return _static_html(request, _HOME_BYTES, _HOME_HEADERS)
 
 
-handler = Mangum(app)
+# Lambda entry point; lambda_function.py re-exports this instead of wrapping the app again.
+# The app registers no startup/shutdown hooks, so the lifespan handshake is skipped.
+handler = Mangum(app, lifespan="off")
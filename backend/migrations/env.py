@@ -55,14 +55,14 @@ def run_migrations_online() -> None:
         with context.begin_transaction():
             context.run_migrations()
 
+SUPABASE_SCHEMAS = frozenset({'auth', 'storage', 'realtime', 'vault', 'supabase_functions', 'extensions', 'graphql', 'graphql_public', 'pgsodium', 'pgsodium_masks'})
+SUPABASE_TABLES = frozenset({'schema_migrations', 'supabase_migrations'})
+
 def include_object(object, name, type_, reflected, compare_to):
-    supabase_schemas = {'auth', 'storage', 'realtime', 'vault', 'supabase_functions', 'extensions', 'graphql', 'graphql_public', 'pgsodium', 'pgsodium_masks'}
-    
-    if hasattr(object, 'schema') and object.schema in supabase_schemas:
+    if getattr(object, 'schema', None) in SUPABASE_SCHEMAS:
         return False
     
-    supabase_tables = {'schema_migrations', 'supabase_migrations'}
-    if type_ == "table" and name in supabase_tables:
+    if type_ == "table" and name in SUPABASE_TABLES:
         return False
     
     return True
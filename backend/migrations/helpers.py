@@ -0,0 +1,71 @@
+"""
+Shared helpers for data migrations
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql.util import ClauseAdapter
+
+
+def batched_update(
+    table: sa.Table,
+    values: Dict[str, Any],
+    where: Optional[Any] = None,
+    page_size: int = 100,
+) -> int:
+    """
+    Apply an UPDATE to `table` in keyset-paginated batches of `page_size` rows.
+
+    Each batch runs in its own transaction inside an autocommit block, so row locks
+    are held briefly and the migration never materializes the whole table at once.
+    `where` may reference columns of `table`; rows are walked in primary-key order.
+    Returns the number of rows updated.
+    """
+    conn = op.get_bind()
+    page = table.alias("page")
+    last_id = None
+    total = 0
+
+    with op.get_context().autocommit_block():
+        while True:
+            batch = sa.select(page.c.id).order_by(page.c.id).limit(page_size)
+            if where is not None:
+                batch = batch.where(ClauseAdapter(page).traverse(where))
+            if last_id is not None:
+                batch = batch.where(page.c.id > last_id)
+
+            updated_ids = conn.execute(
+                sa.update(table)
+                .where(table.c.id.in_(batch.scalar_subquery()))
+                .values(values)
+                .returning(table.c.id)
+            ).scalars().all()
+
+            if not updated_ids:
+                break
+            total += len(updated_ids)
+            last_id = max(updated_ids)
+
+    return total
+
+
+@contextmanager
+def jsonb_to_text_array_function() -> Iterator[str]:
+    """
+    Provide a temporary SQL function for ALTER COLUMN jsonb -> text[] USING clauses.
+
+    USING can't take a subquery, so JSON arrays are unpacked through this function;
+    non-array values become NULL. Yields the function name and drops it afterwards.
+    """
+    op.execute("""
+        CREATE FUNCTION _jsonb_to_text_array(value jsonb) RETURNS text[] AS $$
+            SELECT CASE
+                WHEN jsonb_typeof(value) = 'array'
+                    THEN ARRAY(SELECT jsonb_array_elements_text(value))
+            END
+        $$ LANGUAGE sql IMMUTABLE
+    """)
+    yield "_jsonb_to_text_array"
+    op.execute('DROP FUNCTION _jsonb_to_text_array(jsonb)')
@@ -5,124 +5,76 @@ from sqlalchemy import (
     DateTime, 
     SmallInteger,
     CheckConstraint,
-    PrimaryKeyConstraint,
     UniqueConstraint,
     Index,
     Computed,
     text,
     ForeignKey,
-    Column,
     Float,
-    Integer
+    Integer,
+    BigInteger,
+    Numeric
 )
-from sqlalchemy.orm import foreign
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from geoalchemy2 import Geography, WKBElement
 from typing import Optional, List
+import os
 import uuid
 
-Base = declarative_base()
+from utils.ids import uuid7
+
+__all__ = [
+    "Base",
+    "Users",
+    "UserProfile",
+    "VendorProfile",
+    "SupplierProfile",
+    "Review",
+    "Category",
+    "Product",
+    "BulkPricingTier",
+    "Order",
+    "BulkOrderWindow",
+    "Payment",
+    "SupplierSubscription",
+]
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+# Relationships never lazy-load with SQL (callers must selectinload/joinedload).
+# Strict mode also refuses identity-map lookups; enable it in dev/CI to catch
+# every implicit access, not only the ones that would hit the database.
+STRICT_LOADING = os.getenv("SQLALCHEMY_STRICT_LOADING", "false").lower() == "true"
+_DEFAULT_LAZY = "raise" if STRICT_LOADING else "raise_on_sql"
+
+
+def rel(*args, **kwargs):
+    """relationship() with this module's default loader strategy"""
+    kwargs.setdefault("lazy", _DEFAULT_LAZY)
+    return relationship(*args, **kwargs)
 
 
 class Users(Base):
     """
-    Supabase auth.users table schema
-    This mirrors the Supabase authentication table to enable proper foreign key relationships
+    Supabase auth.users table
+    Only the primary key is declared: GoTrue owns the rest of the schema and
+    the app never reads it, so this exists purely as a foreign key target
     """
     __tablename__ = "users"
-    __table_args__ = (
-        CheckConstraint(
-            "email_change_confirm_status >= 0 AND email_change_confirm_status <= 2",
-            name="users_email_change_confirm_status_check",
-        ),
-        PrimaryKeyConstraint("id", name="users_pkey"),
-        UniqueConstraint("phone", name="users_phone_key"),
-        Index("confirmation_token_idx", "confirmation_token", unique=True),
-        Index(
-            "email_change_token_current_idx", "email_change_token_current", unique=True
-        ),
-        Index("email_change_token_new_idx", "email_change_token_new", unique=True),
-        Index("reauthentication_token_idx", "reauthentication_token", unique=True),
-        Index("recovery_token_idx", "recovery_token", unique=True),
-        Index("users_email_partial_key", "email", unique=True),
-        Index("users_instance_id_email_idx", "instance_id"),
-        Index("users_instance_id_idx", "instance_id"),
-        Index("users_is_anonymous_idx", "is_anonymous"),
-        {
-            "comment": "Auth: Stores user login data within a secure schema.",
-            "schema": "auth",
-        },
-    )
+    __table_args__ = {"schema": "auth"}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
-    
-    is_sso_user: Mapped[bool] = mapped_column(
-        Boolean,
-        nullable=False,
-        server_default=text("false"),
-        comment="Auth: Set this column to true when the account comes from SSO. These accounts can have duplicate emails.",
-    )
-    is_anonymous: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
-    instance_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
-    aud: Mapped[Optional[str]] = mapped_column(String(255))
-    role: Mapped[Optional[str]] = mapped_column(String(255))
-    
-    email: Mapped[Optional[str]] = mapped_column(String(255))
-    phone: Mapped[Optional[str]] = mapped_column(Text, server_default=text("NULL::character varying"))
-    
-    encrypted_password: Mapped[Optional[str]] = mapped_column(String(255))
-    
-    email_confirmed_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    confirmation_token: Mapped[Optional[str]] = mapped_column(String(255))
-    confirmation_sent_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    recovery_token: Mapped[Optional[str]] = mapped_column(String(255))
-    recovery_sent_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    email_change_token_new: Mapped[Optional[str]] = mapped_column(String(255))
-    email_change: Mapped[Optional[str]] = mapped_column(String(255))
-    email_change_sent_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    email_change_token_current: Mapped[Optional[str]] = mapped_column(
-        String(255), server_default=text("''::character varying")
-    )
-    email_change_confirm_status: Mapped[Optional[int]] = mapped_column(SmallInteger, server_default=text("0"))
-    
-    phone_confirmed_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    phone_change: Mapped[Optional[str]] = mapped_column(Text, server_default=text("''::character varying"))
-    phone_change_token: Mapped[Optional[str]] = mapped_column(
-        String(255), server_default=text("''::character varying")
-    )
-    phone_change_sent_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    last_sign_in_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    invited_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    raw_app_meta_data: Mapped[Optional[dict]] = mapped_column(JSONB)
-    raw_user_meta_data: Mapped[Optional[dict]] = mapped_column(JSONB)
-    
-    is_super_admin: Mapped[Optional[bool]] = mapped_column(Boolean)
-    banned_until: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    reauthentication_token: Mapped[Optional[str]] = mapped_column(
-        String(255), server_default=text("''::character varying")
-    )
-    reauthentication_sent_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    created_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    deleted_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
-    
-    confirmed_at: Mapped[Optional[DateTime]] = mapped_column(
-        DateTime(True),
-        Computed("LEAST(email_confirmed_at, phone_confirmed_at)", persisted=True),
-    )
 
-    user_profile: Mapped[Optional["UserProfile"]] = relationship(
+    user_profile: Mapped[Optional["UserProfile"]] = rel(
         "UserProfile", 
         back_populates="user", 
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
 
@@ -132,8 +84,22 @@ class UserProfile(Base):
     This extends the basic auth.users table with application-specific data
     """
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        CheckConstraint(
+            "role IN ('user', 'vendor', 'supplier', 'admin')",
+            name="user_profiles_role_check",
+        ),
+        Index(
+            "ix_user_profiles_preferences_gin",
+            "preferences",
+            postgresql_using="gin",
+            postgresql_ops={"preferences": "jsonb_path_ops"},
+        ),
+        # Usernames are unique regardless of case; lookups filter on lower(username)
+        Index("ix_user_profiles_username_lower", text("lower((username)::text)"), unique=True),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("auth.users.id", ondelete="CASCADE"),
@@ -141,15 +107,15 @@ class UserProfile(Base):
         nullable=False
     )
     
-    username: Mapped[Optional[str]] = mapped_column(String(100), unique=True, index=True)
+    username: Mapped[Optional[str]] = mapped_column(String(100))
     first_name: Mapped[Optional[str]] = mapped_column(String(100))
     last_name: Mapped[Optional[str]] = mapped_column(String(100))
     display_name: Mapped[Optional[str]] = mapped_column(String(100))
     bio: Mapped[Optional[str]] = mapped_column(Text)
-    avatar_url: Mapped[Optional[str]] = mapped_column(String(500))
+    avatar_url: Mapped[Optional[str]] = mapped_column(Text)
     
     # Role-based access control
-    role: Mapped[str] = mapped_column(String(50), default="user", nullable=False)
+    role: Mapped[str] = mapped_column(String(50), default="user", server_default="user", nullable=False)
     
     date_of_birth: Mapped[Optional[DateTime]] = mapped_column(DateTime(True))
     timezone: Mapped[Optional[str]] = mapped_column(String(50))
@@ -169,28 +135,67 @@ class UserProfile(Base):
         nullable=False
     )
     
-    user: Mapped["Users"] = relationship("Users", back_populates="user_profile")
-    vendor_profile: Mapped[Optional["VendorProfile"]] = relationship(
+    user: Mapped["Users"] = rel("Users", back_populates="user_profile")
+    vendor_profile: Mapped[Optional["VendorProfile"]] = rel(
         "VendorProfile", 
         back_populates="user_profile", 
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
-    supplier_profile: Mapped[Optional["SupplierProfile"]] = relationship(
+    supplier_profile: Mapped[Optional["SupplierProfile"]] = rel(
         "SupplierProfile", 
         back_populates="user_profile", 
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
-    reviews_given: Mapped[List["Review"]] = relationship(
+    reviews_given: Mapped[List["Review"]] = rel(
         "Review",
         foreign_keys="Review.reviewer_user_id",
-        back_populates="reviewer_user_profile"
+        back_populates="reviewer_user_profile",
+        passive_deletes=True
     )
-    reviews_received: Mapped[List["Review"]] = relationship(
+    reviews_received: Mapped[List["Review"]] = rel(
         "Review",
         foreign_keys="Review.reviewed_user_id",
-        back_populates="reviewed_user_profile"
+        back_populates="reviewed_user_profile",
+        passive_deletes=True
+    )
+    # Unbounded per-user collections: never loaded implicitly, query with a LIMIT instead
+    orders_as_buyer: Mapped[List["Order"]] = rel(
+        "Order",
+        foreign_keys="Order.buyer_id",
+        back_populates="buyer",
+        passive_deletes=True
+    )
+    orders_as_seller: Mapped[List["Order"]] = rel(
+        "Order",
+        foreign_keys="Order.seller_id",
+        back_populates="seller",
+        passive_deletes=True
+    )
+    created_bulk_windows: Mapped[List["BulkOrderWindow"]] = rel(
+        "BulkOrderWindow",
+        back_populates="creator",
+        passive_deletes=True
+    )
+    payments: Mapped[List["Payment"]] = rel(
+        "Payment",
+        back_populates="user",
+        passive_deletes=True
+    )
+    supplier_subscriptions: Mapped[List["SupplierSubscription"]] = rel(
+        "SupplierSubscription",
+        foreign_keys="SupplierSubscription.vendor_user_id",
+        back_populates="vendor",
+        passive_deletes=True
+    )
+    subscribers: Mapped[List["SupplierSubscription"]] = rel(
+        "SupplierSubscription",
+        foreign_keys="SupplierSubscription.supplier_user_id",
+        back_populates="supplier",
+        passive_deletes=True
     )
 
 
@@ -199,8 +204,15 @@ class VendorProfile(Base):
     Vendor-specific profile information for local street vendors
     """
     __tablename__ = "vendor_profiles"
+    __table_args__ = (
+        Index("ix_vendor_profiles_specialties_gin", "specialties", postgresql_using="gin"),
+        Index("ix_vendor_profiles_payment_methods_gin", "payment_methods", postgresql_using="gin"),
+        Index("ix_vendor_location_gist", "location", postgresql_using="gist"),
+        CheckConstraint("average_rating >= 0 AND average_rating <= 5", name="vendor_profiles_average_rating_check"),
+        CheckConstraint("balance >= 0", name="vendor_profiles_balance_check"),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     user_profile_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("user_profiles.id", ondelete="CASCADE"),
@@ -215,12 +227,20 @@ class VendorProfile(Base):
     postal_code: Mapped[Optional[str]] = mapped_column(String(20))
     latitude: Mapped[Optional[float]] = mapped_column(Float)
     longitude: Mapped[Optional[float]] = mapped_column(Float)
+    # Derived from latitude/longitude for ST_DWithin proximity queries; never
+    # written by the app and not fetched unless asked for
+    location: Mapped[Optional[WKBElement]] = mapped_column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        Computed("ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography", persisted=True),
+        deferred=True,
+        deferred_raiseload=True
+    )
     operating_hours: Mapped[Optional[dict]] = mapped_column(JSONB)  # JSON for flexible schedule
     
     # Business Details
     description: Mapped[Optional[str]] = mapped_column(Text)
-    specialties: Mapped[Optional[list]] = mapped_column(JSONB)  # Array of specialties
-    payment_methods: Mapped[Optional[list]] = mapped_column(JSONB)  # Accepted payment methods
+    specialties: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))  # Array of specialties
+    payment_methods: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))  # Accepted payment methods
     
     # Contact Information
     phone_number: Mapped[Optional[str]] = mapped_column(String(20))
@@ -230,11 +250,18 @@ class VendorProfile(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
     # Rating System
-    average_rating: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    # Sum/count of visible ratings, maintained incrementally by the
+    # trg_reviews_aggregate trigger on reviews; never set from the app
     total_reviews: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    average_rating: Mapped[float] = mapped_column(
+        Numeric(3, 2, asdecimal=False),
+        Computed("COALESCE(round(rating_sum::numeric / NULLIF(total_reviews, 0), 2), 0)", persisted=True),
+        nullable=False,
+    )
     
     # Balance for payments
-    balance: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    balance: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), default=0.0, nullable=False)
     
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(True), 
@@ -248,19 +275,7 @@ class VendorProfile(Base):
         nullable=False
     )
     
-    user_profile: Mapped["UserProfile"] = relationship("UserProfile", back_populates="vendor_profile")
-    reviews_received: Mapped[list["Review"]] = relationship(
-        "Review", 
-        back_populates="reviewed_vendor",
-        primaryjoin="VendorProfile.user_profile_id == foreign(Review.reviewed_user_id)",
-        viewonly=True
-    )
-    reviews_given: Mapped[list["Review"]] = relationship(
-        "Review", 
-        back_populates="reviewer_vendor",
-        primaryjoin="VendorProfile.user_profile_id == foreign(Review.reviewer_user_id)",
-        viewonly=True
-    )
+    user_profile: Mapped["UserProfile"] = rel("UserProfile", back_populates="vendor_profile")
 
 
 class SupplierProfile(Base):
@@ -268,8 +283,16 @@ class SupplierProfile(Base):
     Supplier-specific profile information for wholesale suppliers
     """
     __tablename__ = "supplier_profiles"
+    __table_args__ = (
+        Index("ix_supplier_profiles_certifications_gin", "certifications", postgresql_using="gin"),
+        # Supplier search filters city/state with ILIKE '%term%'
+        Index("ix_supplier_profiles_city_trgm", "city", postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"}),
+        Index("ix_supplier_profiles_state_trgm", "state", postgresql_using="gin", postgresql_ops={"state": "gin_trgm_ops"}),
+        CheckConstraint("average_rating >= 0 AND average_rating <= 5", name="supplier_profiles_average_rating_check"),
+        CheckConstraint("balance >= 0", name="supplier_profiles_balance_check"),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     user_profile_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("user_profiles.id", ondelete="CASCADE"),
@@ -299,10 +322,10 @@ class SupplierProfile(Base):
     phone_number: Mapped[Optional[str]] = mapped_column(String(20))
     alternate_phone: Mapped[Optional[str]] = mapped_column(String(20))
     email: Mapped[Optional[str]] = mapped_column(String(255))
-    website_url: Mapped[Optional[str]] = mapped_column(String(500))
+    website_url: Mapped[Optional[str]] = mapped_column(Text)
     
     # Business Credentials
-    certifications: Mapped[Optional[list]] = mapped_column(JSONB)  # Business certifications
+    certifications: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))  # Business certifications
     years_in_business: Mapped[Optional[int]] = mapped_column(Integer)
     
     # Business Status
@@ -310,11 +333,18 @@ class SupplierProfile(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
     # Rating System
-    average_rating: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    # Sum/count of visible ratings, maintained incrementally by the
+    # trg_reviews_aggregate trigger on reviews; never set from the app
     total_reviews: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    average_rating: Mapped[float] = mapped_column(
+        Numeric(3, 2, asdecimal=False),
+        Computed("COALESCE(round(rating_sum::numeric / NULLIF(total_reviews, 0), 2), 0)", persisted=True),
+        nullable=False,
+    )
     
     # Balance for payments
-    balance: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    balance: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), default=0.0, nullable=False)
     
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(True), 
@@ -328,23 +358,12 @@ class SupplierProfile(Base):
         nullable=False
     )
     
-    user_profile: Mapped["UserProfile"] = relationship("UserProfile", back_populates="supplier_profile")
-    products: Mapped[List["Product"]] = relationship(
+    user_profile: Mapped["UserProfile"] = rel("UserProfile", back_populates="supplier_profile")
+    products: Mapped[List["Product"]] = rel(
         "Product", 
         back_populates="supplier_profile",
-        cascade="all, delete-orphan"
-    )
-    reviews_received: Mapped[list["Review"]] = relationship(
-        "Review", 
-        back_populates="reviewed_supplier",
-        primaryjoin="SupplierProfile.user_profile_id == foreign(Review.reviewed_user_id)",
-        viewonly=True
-    )
-    reviews_given: Mapped[list["Review"]] = relationship(
-        "Review", 
-        back_populates="reviewer_supplier",
-        primaryjoin="SupplierProfile.user_profile_id == foreign(Review.reviewer_user_id)",
-        viewonly=True
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
 
@@ -354,12 +373,30 @@ class Review(Base):
     """
     __tablename__ = "reviews"
     __table_args__ = (
-        UniqueConstraint("reviewer_user_id", "reviewed_user_id", name="unique_review_per_user_pair"),
+        # One review per pair per transaction; NULLS NOT DISTINCT keeps a single
+        # transaction-less review per pair
+        UniqueConstraint(
+            "reviewer_user_id",
+            "reviewed_user_id",
+            "transaction_id",
+            name="unique_review_per_transaction",
+            postgresql_nulls_not_distinct=True,
+        ),
         CheckConstraint("rating >= 1 AND rating <= 5", name="rating_range_check"),
         CheckConstraint("reviewer_user_id != reviewed_user_id", name="no_self_review_check"),
+        # Profile review page and rating recalculation only read visible reviews
+        Index(
+            "ix_reviews_reviewed_created",
+            "reviewed_user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_hidden = false"),
+        ),
+        # ON DELETE CASCADE from user_profiles must also find hidden reviews,
+        # which the partial index above skips
+        Index("ix_reviews_reviewed_user_id", "reviewed_user_id"),
     )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Reviewer (who is giving the review)
     reviewer_user_id: Mapped[uuid.UUID] = mapped_column(
@@ -376,7 +413,7 @@ class Review(Base):
     )
     
     # Review Content
-    rating: Mapped[int] = mapped_column(Integer, nullable=False)  # 1-5 stars
+    rating: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 1-5 stars
     title: Mapped[Optional[str]] = mapped_column(String(200))
     comment: Mapped[Optional[str]] = mapped_column(Text)
     
@@ -401,40 +438,16 @@ class Review(Base):
     )
     
     # Relationships
-    reviewer_user_profile: Mapped["UserProfile"] = relationship(
+    reviewer_user_profile: Mapped["UserProfile"] = rel(
         "UserProfile",
         foreign_keys=[reviewer_user_id],
         back_populates="reviews_given"
     )
-    reviewed_user_profile: Mapped["UserProfile"] = relationship(
+    reviewed_user_profile: Mapped["UserProfile"] = rel(
         "UserProfile",
         foreign_keys=[reviewed_user_id],
         back_populates="reviews_received"
     )
-    reviewer_vendor: Mapped[Optional["VendorProfile"]] = relationship(
-        "VendorProfile",
-        back_populates="reviews_given",
-        primaryjoin="foreign(Review.reviewer_user_id) == VendorProfile.user_profile_id",
-        viewonly=True
-    )
-    reviewer_supplier: Mapped[Optional["SupplierProfile"]] = relationship(
-        "SupplierProfile",
-        back_populates="reviews_given",
-        primaryjoin="foreign(Review.reviewer_user_id) == SupplierProfile.user_profile_id",
-        viewonly=True
-    )
-    reviewed_vendor: Mapped[Optional["VendorProfile"]] = relationship(
-        "VendorProfile",
-        back_populates="reviews_received",
-        primaryjoin="foreign(Review.reviewed_user_id) == VendorProfile.user_profile_id",
-        viewonly=True
-    )
-    reviewed_supplier: Mapped[Optional["SupplierProfile"]] = relationship(
-        "SupplierProfile",
-        back_populates="reviews_received",
-        primaryjoin="foreign(Review.reviewed_user_id) == SupplierProfile.user_profile_id",
-        viewonly=True
-    )
 
 
 class Category(Base):
@@ -443,7 +456,7 @@ class Category(Base):
     """
     __tablename__ = "categories"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     description: Mapped[Optional[str]] = mapped_column(Text)
     
@@ -469,20 +482,25 @@ class Category(Base):
     )
     
     # Relationships
-    parent: Mapped[Optional["Category"]] = relationship(
+    parent: Mapped[Optional["Category"]] = rel(
         "Category", 
         remote_side="Category.id",
         back_populates="children"
     )
-    children: Mapped[List["Category"]] = relationship(
+    children: Mapped[List["Category"]] = rel(
         "Category", 
         back_populates="parent",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Category.name"
     )
-    products: Mapped[List["Product"]] = relationship(
+    # products.category_id is ON DELETE RESTRICT: never cascade or null it out
+    # from the ORM, let the database refuse the delete
+    products: Mapped[List["Product"]] = rel(
         "Product", 
         back_populates="category",
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        passive_deletes="all"
     )
 
 
@@ -491,8 +509,45 @@ class Product(Base):
     Products listed by suppliers
     """
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_tags_gin", "tags", postgresql_using="gin"),
+        # Product search ORs ILIKE '%term%' over these three; each branch needs
+        # its own trigram index for the planner to BitmapOr them
+        Index("ix_products_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_products_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        Index("ix_products_brand_trgm", "brand", postgresql_using="gin", postgresql_ops={"brand": "gin_trgm_ops"}),
+        # Default jsonb_ops so key-existence (?) filters are indexed too
+        Index(
+            "ix_products_specifications_gin",
+            "specifications",
+            postgresql_using="gin",
+        ),
+        # Indexed JSONB fields: scalar ->> lookups can't use GIN, so hot keys
+        # get their own BTREE expression index. Filters must use the same
+        # expression (specifications ->> 'color', key as a literal) for the planner to match it.
+        Index(
+            "ix_products_spec_color",
+            text("(specifications ->> 'color')"),
+        ),
+        # Supplier catalogue: filter + ORDER BY created_at DESC LIMIT straight off the index
+        Index(
+            "ix_products_supplier_active_created",
+            "supplier_profile_id",
+            "is_active",
+            text("created_at DESC"),
+        ),
+        # Category pages, same shape as the supplier catalogue. Kept full rather
+        # than partial on is_active: the admin category delete counts inactive
+        # products too, and the RESTRICT FK check needs every row
+        Index(
+            "ix_products_category_active_created",
+            "category_id",
+            "is_active",
+            text("created_at DESC"),
+        ),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     supplier_profile_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("supplier_profiles.id", ondelete="CASCADE"),
@@ -514,8 +569,8 @@ class Product(Base):
     model: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Product Images
-    primary_image_url: Mapped[Optional[str]] = mapped_column(String(500))
-    additional_images: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # Array of image URLs
+    primary_image_url: Mapped[Optional[str]] = mapped_column(Text)
+    additional_images: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))  # Array of image URLs
     
     # Inventory
     minimum_order_quantity: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
@@ -523,7 +578,7 @@ class Product(Base):
     
     # Product Details
     specifications: Mapped[Optional[dict]] = mapped_column(JSONB)  # Flexible specifications
-    tags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # Search tags
+    tags: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))  # Search tags
     
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -542,18 +597,19 @@ class Product(Base):
     )
     
     # Relationships
-    supplier_profile: Mapped["SupplierProfile"] = relationship(
+    supplier_profile: Mapped["SupplierProfile"] = rel(
         "SupplierProfile", 
         back_populates="products"
     )
-    category: Mapped["Category"] = relationship(
+    category: Mapped["Category"] = rel(
         "Category", 
         back_populates="products"
     )
-    bulk_pricing_tiers: Mapped[List["BulkPricingTier"]] = relationship(
+    bulk_pricing_tiers: Mapped[List["BulkPricingTier"]] = rel(
         "BulkPricingTier", 
         back_populates="product",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="BulkPricingTier.min_quantity"
     )
 
@@ -568,10 +624,11 @@ class BulkPricingTier(Base):
         CheckConstraint("min_quantity > 0", name="min_quantity_positive_check"),
         CheckConstraint("max_quantity > min_quantity OR max_quantity IS NULL", name="max_quantity_greater_check"),
         CheckConstraint("price_per_unit > 0", name="price_positive_check"),
+        # Also serves the relationship's ORDER BY min_quantity; no separate index needed
         UniqueConstraint("product_id", "min_quantity", name="unique_product_min_quantity"),
     )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     product_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("products.id", ondelete="CASCADE"),
@@ -583,7 +640,7 @@ class BulkPricingTier(Base):
     max_quantity: Mapped[Optional[int]] = mapped_column(Integer)  # NULL means unlimited
     
     # Pricing
-    price_per_unit: Mapped[float] = mapped_column(Float, nullable=False)
+    price_per_unit: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
     
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(True), 
@@ -598,7 +655,7 @@ class BulkPricingTier(Base):
     )
     
     # Relationships
-    product: Mapped["Product"] = relationship(
+    product: Mapped["Product"] = rel(
         "Product", 
         back_populates="bulk_pricing_tiers"
     )
@@ -610,11 +667,27 @@ class Order(Base):
     """
     __tablename__ = "orders"
     __table_args__ = (
-        CheckConstraint("total_amount > 0", name="total_amount_positive_check"),
-        CheckConstraint("quantity > 0", name="quantity_positive_check"),
+        CheckConstraint("quantity > 0 AND total_amount > 0", name="orders_positive_amounts_check"),
+        CheckConstraint("order_type IN ('buy_now', 'buy_now_pay_later', 'bulk_order')", name="orders_order_type_check"),
+        CheckConstraint("payment_status IN ('pending', 'paid', 'failed', 'refunded')", name="orders_payment_status_check"),
+        CheckConstraint(
+            "order_status IN ('confirmed', 'processing', 'shipped', 'delivered', 'cancelled')",
+            name="orders_order_status_check",
+        ),
+        Index("ix_orders_buyer_id_created_at", "buyer_id", "created_at"),
+        Index("ix_orders_seller_id_order_status", "seller_id", "order_status"),
+        # Supplier order list, newest first
+        Index("ix_orders_seller_id_created_at", "seller_id", text("created_at DESC")),
+        # Outstanding pay-later orders, listed per buyer by due date
+        Index(
+            "ix_orders_pending",
+            "buyer_id",
+            "due_date",
+            postgresql_where=text("payment_status = 'pending'"),
+        ),
     )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Order participants
     buyer_id: Mapped[uuid.UUID] = mapped_column(
@@ -632,11 +705,12 @@ class Order(Base):
     product_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("products.id", ondelete="RESTRICT"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
-    price_per_unit: Mapped[float] = mapped_column(Float, nullable=False)
-    total_amount: Mapped[float] = mapped_column(Float, nullable=False)
+    price_per_unit: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
+    total_amount: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
     
     # Order type and payment
     order_type: Mapped[str] = mapped_column(String(50), nullable=False)  # "buy_now", "buy_now_pay_later", "bulk_order"
@@ -646,7 +720,8 @@ class Order(Base):
     # Bulk order reference (if part of bulk order)
     bulk_order_window_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), 
-        ForeignKey("bulk_order_windows.id", ondelete="SET NULL")
+        ForeignKey("bulk_order_windows.id", ondelete="SET NULL"),
+        index=True
     )
     
     # Order status
@@ -673,18 +748,18 @@ class Order(Base):
     )
     
     # Relationships
-    buyer: Mapped["UserProfile"] = relationship(
+    buyer: Mapped["UserProfile"] = rel(
         "UserProfile",
         foreign_keys=[buyer_id],
-        backref="orders_as_buyer"
+        back_populates="orders_as_buyer"
     )
-    seller: Mapped["UserProfile"] = relationship(
+    seller: Mapped["UserProfile"] = rel(
         "UserProfile",
         foreign_keys=[seller_id],
-        backref="orders_as_seller"
+        back_populates="orders_as_seller"
     )
-    product: Mapped["Product"] = relationship("Product")
-    bulk_order_window: Mapped[Optional["BulkOrderWindow"]] = relationship("BulkOrderWindow", back_populates="orders")
+    product: Mapped["Product"] = rel("Product")
+    bulk_order_window: Mapped[Optional["BulkOrderWindow"]] = rel("BulkOrderWindow", back_populates="orders")
 
 
 class BulkOrderWindow(Base):
@@ -692,14 +767,24 @@ class BulkOrderWindow(Base):
     Bulk order windows where multiple vendors can join to get bulk pricing
     """
     __tablename__ = "bulk_order_windows"
+    __table_args__ = (
+        CheckConstraint("status IN ('open', 'closed', 'finalized')", name="bulk_order_windows_status_check"),
+        # Only open windows are listed or swept by the closing job
+        Index(
+            "ix_bulk_windows_open",
+            "window_end_time",
+            postgresql_where=text("status = 'open'"),
+        ),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Window creator
     creator_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("user_profiles.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     
     # Window details
@@ -719,7 +804,7 @@ class BulkOrderWindow(Base):
     
     # Totals (calculated when window closes)
     total_participants: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    total_amount: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    total_amount: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), default=0.0, nullable=False)
     
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(True), 
@@ -734,8 +819,8 @@ class BulkOrderWindow(Base):
     )
     
     # Relationships
-    creator: Mapped["UserProfile"] = relationship("UserProfile", backref="created_bulk_windows")
-    orders: Mapped[List["Order"]] = relationship("Order", back_populates="bulk_order_window")
+    creator: Mapped["UserProfile"] = rel("UserProfile", back_populates="created_bulk_windows")
+    orders: Mapped[List["Order"]] = rel("Order", back_populates="bulk_order_window")
 
 
 class Payment(Base):
@@ -743,18 +828,41 @@ class Payment(Base):
     Payment transactions for adding balance via Razorpay
     """
     __tablename__ = "payments"
+    __table_args__ = (
+        CheckConstraint("status IN ('pending', 'completed', 'failed', 'refunded')", name="payments_status_check"),
+        Index(
+            "ix_payments_metadata_gin",
+            "payment_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"payment_metadata": "jsonb_path_ops"},
+        ),
+        # Razorpay ids are natural keys once assigned
+        Index(
+            "uq_payments_razorpay_order_id",
+            "razorpay_order_id",
+            unique=True,
+            postgresql_where=text("razorpay_order_id IS NOT NULL"),
+        ),
+        Index(
+            "uq_payments_razorpay_payment_id",
+            "razorpay_payment_id",
+            unique=True,
+            postgresql_where=text("razorpay_payment_id IS NOT NULL"),
+        ),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # User who made the payment
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("user_profiles.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     
     # Payment details
-    amount: Mapped[float] = mapped_column(Float, nullable=False)
+    amount: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
     currency: Mapped[str] = mapped_column(String(10), default="INR", nullable=False)
     payment_method: Mapped[str] = mapped_column(String(50), default="razorpay", nullable=False)
     
@@ -783,7 +891,7 @@ class Payment(Base):
     )
     
     # Relationships
-    user: Mapped["UserProfile"] = relationship("UserProfile", backref="payments")
+    user: Mapped["UserProfile"] = rel("UserProfile", back_populates="payments")
 
 
 class SupplierSubscription(Base):
@@ -795,7 +903,7 @@ class SupplierSubscription(Base):
         UniqueConstraint("vendor_user_id", "supplier_user_id", name="unique_vendor_supplier_subscription"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     vendor_user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
@@ -815,5 +923,5 @@ class SupplierSubscription(Base):
     )
 
     # Relationships
-    vendor: Mapped["UserProfile"] = relationship("UserProfile", foreign_keys=[vendor_user_id], backref="supplier_subscriptions")
-    supplier: Mapped["UserProfile"] = relationship("UserProfile", foreign_keys=[supplier_user_id], backref="subscribers")
+    vendor: Mapped["UserProfile"] = rel("UserProfile", foreign_keys=[vendor_user_id], back_populates="supplier_subscriptions")
+    supplier: Mapped["UserProfile"] = rel("UserProfile", foreign_keys=[supplier_user_id], back_populates="subscribers")
@@ -7,10 +7,13 @@ from routers.products.schemas import (
     CategoryWithChildrenResponse, CategoryListResponse
 )
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, delete
+from sqlalchemy.orm import aliased, raiseload, selectinload
+from sqlalchemy.exc import IntegrityError
 from config import get_db, get_supabase_client
 from models import UserProfile, Category
 from utils.response_helpers import safe_model_validate, safe_model_validate_list, user_profile_to_dict, category_to_dict
+from utils.pagination import encode_cursor, decode_cursor
 from typing import Optional
 from datetime import datetime
 import logging
@@ -21,6 +24,10 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["Admin"])
 supabase = get_supabase_client()
 
+# PostgreSQL SQLSTATEs for an unknown parent_id and a duplicate name
+FOREIGN_KEY_VIOLATION = "23503"
+UNIQUE_VIOLATION = "23505"
+
 def category_to_response(category: Category) -> CategoryResponse:
     """Helper function to convert Category model to CategoryResponse"""
     category_dict = category_to_dict(category)
@@ -28,26 +35,56 @@ def category_to_response(category: Category) -> CategoryResponse:
 
 @router.get("/users", response_model=UserListResponse)
 async def list_all_users(
-    page: int = 1,
-    limit: int = 20,
+    page: int = Query(1, ge=1, deprecated=True),
+    limit: int = Query(20, ge=1, le=100),
     role: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(require_user_management)
 ):
     """
     Admin only: List all users with pagination and optional role filter
+    
+    Pass next_cursor back as cursor to seek by id instead of OFFSET; page is
+    kept for existing clients.
     """
+    after_id = None
+    if cursor:
+        try:
+            after_id = uuid.UUID(decode_cursor(cursor))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
     try:
-        offset = (page - 1) * limit
+        if after_id:
+            # Keyset mode: an index seek past the last id, without the full count
+            query = select(UserProfile).where(UserProfile.id > after_id)
+        else:
+            # Total row count comes back on every row via a window, so one round trip
+            offset = (page - 1) * limit
+            query = select(UserProfile, func.count().over().label("total")).offset(offset)
         
-        query = select(UserProfile)
-        if role:
-            query = query.where(UserProfile.role == role)
+        filters = [UserProfile.role == role] if role else []
+        query = query.options(raiseload("*")).where(*filters)
         
-        query = query.offset(offset).limit(limit)
+        # One extra row tells us whether another page exists
+        query = query.order_by(UserProfile.id).limit(limit + 1)
         result = await db.execute(query)
-        users = result.scalars().all()
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if after_id:
+            total = None
+        elif rows:
+            total = rows[0].total
+        else:
+            # Past the last page the window has no row to report on; count directly
+            total = (await db.execute(select(func.count(UserProfile.id)).where(*filters))).scalar()
+        users = [row[0] for row in rows]
         
         # Use safe model validation to handle UUID conversion
         user_list = [safe_model_validate(UserListItem, user) for user in users]
@@ -56,7 +93,8 @@ async def list_all_users(
             users=user_list,
             page=page,
             limit=limit,
-            total=len(users)
+            total=total,
+            next_cursor=encode_cursor(users[-1].id) if has_more else None
         )
         
     except Exception as e:
@@ -118,7 +156,6 @@ async def update_user_role(
             logger.error(f"Failed to update Supabase metadata: {str(supabase_error)}")
         
         await db.commit()
-        await db.refresh(user_profile)
         
         return {
             "message": f"User role updated from {old_role} to {new_role}",
@@ -154,30 +191,8 @@ async def create_category(
 ):
     """Admin only: Create a new product category"""
     try:
-        # Check if parent category exists (if provided)
-        if category_data.parent_id:
-            result = await db.execute(
-                select(Category).where(Category.id == category_data.parent_id)
-            )
-            parent_category = result.scalar_one_or_none()
-            if not parent_category:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Parent category not found"
-                )
-        
-        # Check if category name already exists
-        result = await db.execute(
-            select(Category).where(Category.name == category_data.name)
-        )
-        existing_category = result.scalar_one_or_none()
-        if existing_category:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Category name already exists"
-            )
-        
-        # Create category
+        # Name uniqueness and the parent FK are enforced by the database;
+        # violations surface as IntegrityError below
         category = Category(**category_data.model_dump())
         db.add(category)
         await db.commit()
@@ -188,6 +203,24 @@ async def create_category(
         
     except HTTPException:
         raise
+    except IntegrityError as e:
+        await db.rollback()
+        sqlstate = getattr(e.orig, "sqlstate", None)
+        if sqlstate == FOREIGN_KEY_VIOLATION:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Parent category not found"
+            )
+        if sqlstate == UNIQUE_VIOLATION:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Category name already exists"
+            )
+        logger.error(f"Error creating category: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create category"
+        )
     except Exception as e:
         logger.error(f"Error creating category: {str(e)}")
         await db.rollback()
@@ -199,58 +232,68 @@ async def create_category(
 
 @router.get("/categories", response_model=CategoryListResponse)
 async def list_categories(
-    page: int = Query(1, ge=1),
+    page: int = Query(1, ge=1, deprecated=True),
     limit: int = Query(20, ge=1, le=100),
     parent_id: Optional[str] = Query(None),
     include_inactive: bool = Query(False),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(require_admin)
 ):
-    """Admin only: List all categories with pagination"""
+    """Admin only: List all categories with pagination (page or name cursor)"""
+    after_name = None
+    if cursor:
+        try:
+            after_name = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
     try:
-        # Build query
-        query = select(Category)
-        
-        if parent_id:
-            query = query.where(Category.parent_id == parent_id)
+        if after_name is not None:
+            # Keyset mode: names are unique, so seek past the last one seen
+            query = select(Category).where(Category.name > after_name)
         else:
-            query = query.where(Category.parent_id.is_(None))  # Root categories only
+            # The windowed count carries the total alongside each row
+            offset = (page - 1) * limit
+            query = select(Category, func.count().over().label("total")).offset(offset)
         
-        if not include_inactive:
-            query = query.where(Category.is_active == True)
-        
-        # Get total count
-        count_query = select(func.count(Category.id)).where(
+        filters = [
+            # Root categories only unless a parent is given
             Category.parent_id == parent_id if parent_id else Category.parent_id.is_(None)
-        )
+        ]
         if not include_inactive:
-            count_query = count_query.where(Category.is_active == True)
+            filters.append(Category.is_active == True)
         
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        query = query.options(
+            selectinload(Category.children.and_(Category.is_active == True)),
+            raiseload("*"),
+        ).where(*filters)
         
-        # Apply pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit).order_by(Category.name)
+        # One extra row tells us whether another page exists
+        query = query.order_by(Category.name).limit(limit + 1)
         
         result = await db.execute(query)
-        categories = result.scalars().all()
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if after_name is not None:
+            total = None
+        elif rows:
+            total = rows[0].total
+        else:
+            # Past the last page the window has no row to report on; count directly
+            total = (await db.execute(select(func.count(Category.id)).where(*filters))).scalar()
+        categories = [row[0] for row in rows]
         
-        # Get children for each category
+        # Children of the whole page were loaded with one IN query above
         categories_with_children = []
         for category in categories:
-            # Get children
-            children_result = await db.execute(
-                select(Category)
-                .where(Category.parent_id == category.id)
-                .where(Category.is_active == True)
-                .order_by(Category.name)
-            )
-            children = children_result.scalars().all()
-            
             # Convert children to response models
-            children_responses = [category_to_response(child) for child in children]
+            children_responses = [category_to_response(child) for child in category.children]
             
             # Create category response with proper string conversion using helper
             category_dict = category_to_dict(category)
@@ -262,7 +305,8 @@ async def list_categories(
             categories=categories_with_children,
             page=page,
             limit=limit,
-            total=total
+            total=total,
+            next_cursor=encode_cursor(categories[-1].name) if has_more else None
         )
         
     except Exception as e:
@@ -282,9 +326,11 @@ async def get_category(
 ):
     """Admin only: Get category details by ID"""
     try:
-        # Get category
+        # Get category with its children in one extra IN query
         result = await db.execute(
-            select(Category).where(Category.id == category_id)
+            select(Category)
+            .where(Category.id == category_id)
+            .options(selectinload(Category.children), raiseload("*"))
         )
         category = result.scalar_one_or_none()
         
@@ -294,16 +340,8 @@ async def get_category(
                 detail="Category not found"
             )
         
-        # Get children
-        children_result = await db.execute(
-            select(Category)
-            .where(Category.parent_id == category.id)
-            .order_by(Category.name)
-        )
-        children = children_result.scalars().all()
-        
         # Convert children to response models
-        children_responses = [category_to_response(child) for child in children]
+        children_responses = [category_to_response(child) for child in category.children]
         
         # Create category response with proper string conversion using helper
         category_dict = category_to_dict(category)
@@ -408,45 +446,48 @@ async def delete_category(
 ):
     """Admin only: Delete category (only if no products are using it)"""
     try:
-        # Get category
+        # Existence, product usage and subcategory counts in one round trip
+        from models import Product
+        product_count = (
+            select(func.count(Product.id))
+            .where(Product.category_id == Category.id)
+            .scalar_subquery()
+        )
+        children = aliased(Category)
+        children_count = (
+            select(func.count(children.id))
+            .where(children.parent_id == Category.id)
+            .scalar_subquery()
+        )
         result = await db.execute(
-            select(Category).where(Category.id == category_id)
+            select(
+                product_count.label("product_count"),
+                children_count.label("children_count")
+            ).where(Category.id == category_id)
         )
-        category = result.scalar_one_or_none()
+        counts = result.one_or_none()
         
-        if not category:
+        if not counts:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Category not found"
             )
         
-        # Check if category has products (prevent deletion if products exist)
-        from models import Product
-        result = await db.execute(
-            select(func.count(Product.id)).where(Product.category_id == category_id)
-        )
-        product_count = result.scalar()
-        
-        if product_count > 0:
+        if counts.product_count > 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot delete category. {product_count} products are using this category."
+                detail=f"Cannot delete category. {counts.product_count} products are using this category."
             )
         
-        # Check if category has children
-        result = await db.execute(
-            select(func.count(Category.id)).where(Category.parent_id == category_id)
-        )
-        children_count = result.scalar()
-        
-        if children_count > 0:
+        if counts.children_count > 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot delete category. {children_count} subcategories exist under this category."
+                detail=f"Cannot delete category. {counts.children_count} subcategories exist under this category."
             )
         
-        # Delete category
-        await db.delete(category)
+        # Delete category; products.category_id is ON DELETE RESTRICT, so a
+        # product added since the check makes this fail instead of orphaning it
+        await db.execute(delete(Category).where(Category.id == category_id))
         await db.commit()
         
         return {"message": "Category deleted successfully"}
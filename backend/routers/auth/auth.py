@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from config import get_db, get_supabase_client
 from models import UserProfile
 from .schemas import (
@@ -51,17 +51,19 @@ async def get_current_user(
         # Fallback: Get role from database
         logger.info(f"No role in JWT for user {supabase_user.id}, checking database...")
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == supabase_user.id)
+            select(UserProfile.role).where(UserProfile.user_id == supabase_user.id)
         )
-        user_profile = result.scalar_one_or_none()
-        if user_profile:
-            current_user["role"] = user_profile.role
-            logger.info(f"User {supabase_user.id} role from database: {user_profile.role}")
+        profile_role = result.scalar_one_or_none()
+        if profile_role:
+            current_user["role"] = profile_role
+            logger.info(f"User {supabase_user.id} role from database: {profile_role}")
         else:
             current_user["role"] = "user"  # Default fallback
             logger.warning(f"No user profile found for {supabase_user.id}, using default role: user")
 
     request.state.current_user = current_user
+    # Resolved once here so RBAC checks read a plain string
+    request.state.user_role = current_user["role"]
     return current_user
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
@@ -71,7 +73,7 @@ async def register(
 ):
     try:
         existing_user = await db.execute(
-            select(UserProfile).where(UserProfile.username == user_data.username)
+            select(UserProfile.id).where(func.lower(UserProfile.username) == user_data.username.lower())
         )
         if existing_user.scalar_one_or_none():
             raise HTTPException(
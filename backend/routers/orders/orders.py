@@ -74,22 +74,22 @@ async def create_order(
     Create a new order (buy now, buy now pay later, or join bulk order)
     """
     try:
-        # Get buyer profile
-        buyer_result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
-        )
-        buyer_profile = buyer_result.scalar_one_or_none()
-        if not buyer_profile:
+        # Get buyer profile together with its vendor profile (if any)
+        profile_result = await db.execute(
+            select(UserProfile, VendorProfile)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
+        )
+        profile_data = profile_result.first()
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Buyer profile not found"
             )
         
-        # Get vendor profile for balance and eligibility checks
-        vendor_result = await db.execute(
-            select(VendorProfile).where(VendorProfile.user_profile_id == buyer_profile.id)
-        )
-        vendor_profile = vendor_result.scalar_one_or_none()
+        buyer_profile, vendor_profile = profile_data
+        
+        # Vendor profile is required for balance and eligibility checks
         if not vendor_profile:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -256,8 +256,18 @@ async def get_my_orders(
                 detail="User profile not found"
             )
         
-        # Build query
-        query = select(Order).where(Order.buyer_id == user_profile.id)
+        # Build query; product and seller display fields come back in the same row
+        query = select(
+            Order,
+            Product.name,
+            Product.unit,
+            UserProfile.display_name,
+            UserProfile.first_name
+        ).outerjoin(
+            Product, Order.product_id == Product.id
+        ).outerjoin(
+            UserProfile, Order.seller_id == UserProfile.id
+        ).where(Order.buyer_id == user_profile.id)
         
         if order_type:
             query = query.where(Order.order_type == order_type)
@@ -279,29 +289,19 @@ async def get_my_orders(
         query = query.offset(offset).limit(limit).order_by(Order.created_at.desc())
         
         result = await db.execute(query)
-        orders = result.scalars().all()
+        orders = result.all()
         
         # Convert to response models with additional details
         orders_with_details = []
-        for order in orders:
+        for order, product_name, product_unit, seller_display_name, seller_first_name in orders:
             order_dict = safe_model_validate(OrderResponse, order).model_dump()
             
-            # Get product details
-            product_result = await db.execute(
-                select(Product).where(Product.id == order.product_id)
-            )
-            product = product_result.scalar_one_or_none()
-            if product:
-                order_dict["product_name"] = product.name
-                order_dict["product_unit"] = product.unit
+            if product_name is not None:
+                order_dict["product_name"] = product_name
+                order_dict["product_unit"] = product_unit
             
-            # Get seller details
-            seller_result = await db.execute(
-                select(UserProfile).where(UserProfile.id == order.seller_id)
-            )
-            seller = seller_result.scalar_one_or_none()
-            if seller:
-                order_dict["seller_name"] = seller.display_name or seller.first_name
+            if seller_display_name is not None or seller_first_name is not None:
+                order_dict["seller_name"] = seller_display_name or seller_first_name
             
             orders_with_details.append(OrderWithDetailsResponse.model_validate(order_dict))
         
@@ -343,8 +343,17 @@ async def get_pending_payments(
                 detail="User profile not found"
             )
         
-        # Get pending payment orders
-        query = select(Order).where(
+        # Get pending payment orders with product and seller names
+        query = select(
+            Order,
+            Product.name,
+            UserProfile.display_name,
+            UserProfile.first_name
+        ).outerjoin(
+            Product, Order.product_id == Product.id
+        ).outerjoin(
+            UserProfile, Order.seller_id == UserProfile.id
+        ).where(
             and_(
                 Order.buyer_id == user_profile.id,
                 Order.payment_status == "pending",
@@ -353,21 +362,10 @@ async def get_pending_payments(
         ).order_by(Order.due_date.asc())
         
         result = await db.execute(query)
-        orders = result.scalars().all()
+        orders = result.all()
         
         pending_payments = []
-        for order in orders:
-            # Get product and seller details
-            product_result = await db.execute(
-                select(Product).where(Product.id == order.product_id)
-            )
-            product = product_result.scalar_one_or_none()
-            
-            seller_result = await db.execute(
-                select(UserProfile).where(UserProfile.id == order.seller_id)
-            )
-            seller = seller_result.scalar_one_or_none()
-            
+        for order, product_name, seller_display_name, seller_first_name in orders:
             if order.due_date:
                 days_remaining = max(0, (order.due_date - datetime.utcnow()).days)
             else:
@@ -375,8 +373,8 @@ async def get_pending_payments(
             
             pending_payment = PendingPaymentResponse(
                 order_id=str(order.id),
-                product_name=product.name if product else "Unknown Product",
-                seller_name=seller.display_name or seller.first_name if seller else "Unknown Seller",
+                product_name=product_name or "Unknown Product",
+                seller_name=seller_display_name or seller_first_name or "Unknown Seller",
                 total_amount=order.total_amount,
                 due_date=order.due_date,
                 days_remaining=days_remaining
@@ -406,22 +404,22 @@ async def pay_pending_order(
     Pay for a pending order (buy now, pay later)
     """
     try:
-        # Get user profile
-        user_result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
-        )
-        user_profile = user_result.scalar_one_or_none()
-        if not user_profile:
+        # Get user profile together with its vendor profile (if any)
+        profile_result = await db.execute(
+            select(UserProfile, VendorProfile)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
+        )
+        profile_data = profile_result.first()
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get vendor profile for balance
-        vendor_result = await db.execute(
-            select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
-        )
-        vendor_profile = vendor_result.scalar_one_or_none()
+        user_profile, vendor_profile = profile_data
+        
+        # Vendor profile is required for balance
         if not vendor_profile:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -505,22 +503,22 @@ async def create_bulk_order_window(
     Create a new bulk order window
     """
     try:
-        # Get user profile
-        user_result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
-        )
-        user_profile = user_result.scalar_one_or_none()
-        if not user_profile:
+        # Get user profile together with its vendor profile (if any)
+        profile_result = await db.execute(
+            select(UserProfile, VendorProfile)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
+        )
+        profile_data = profile_result.first()
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
+        user_profile, vendor_profile = profile_data
+        
         # Check if user is a vendor
-        vendor_result = await db.execute(
-            select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
-        )
-        vendor_profile = vendor_result.scalar_one_or_none()
         if not vendor_profile:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -641,33 +639,32 @@ async def get_bulk_window_details(
                 detail="Bulk order window not found"
             )
         
-        # Get orders in this window
+        # Get orders in this window with product and buyer display fields
         orders_result = await db.execute(
-            select(Order).where(Order.bulk_order_window_id == window_id)
+            select(
+                Order,
+                Product.name,
+                Product.unit,
+                UserProfile.display_name,
+                UserProfile.first_name
+            )
+            .outerjoin(Product, Order.product_id == Product.id)
+            .outerjoin(UserProfile, Order.buyer_id == UserProfile.id)
+            .where(Order.bulk_order_window_id == window_id)
         )
-        orders = orders_result.scalars().all()
+        orders = orders_result.all()
         
         # Convert orders to response format with details
         orders_with_details = []
-        for order in orders:
+        for order, product_name, product_unit, buyer_display_name, buyer_first_name in orders:
             order_dict = safe_model_validate(OrderResponse, order).model_dump()
             
-            # Get product details
-            product_result = await db.execute(
-                select(Product).where(Product.id == order.product_id)
-            )
-            product = product_result.scalar_one_or_none()
-            if product:
-                order_dict["product_name"] = product.name
-                order_dict["product_unit"] = product.unit
+            if product_name is not None:
+                order_dict["product_name"] = product_name
+                order_dict["product_unit"] = product_unit
             
-            # Get buyer details
-            buyer_result = await db.execute(
-                select(UserProfile).where(UserProfile.id == order.buyer_id)
-            )
-            buyer = buyer_result.scalar_one_or_none()
-            if buyer:
-                order_dict["buyer_name"] = buyer.display_name or buyer.first_name
+            if buyer_display_name is not None or buyer_first_name is not None:
+                order_dict["buyer_name"] = buyer_display_name or buyer_first_name
             
             orders_with_details.append(OrderWithDetailsResponse.model_validate(order_dict))
         
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from config import get_db
 from models import UserProfile, VendorProfile, SupplierProfile, Payment
 from routers.auth.auth import get_current_user
@@ -40,33 +41,26 @@ async def get_balance(
     Get user's current balance
     """
     try:
-        # Get user profile
-        user_result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+        # Get vendor and supplier balances alongside the user profile in one query
+        result = await db.execute(
+            select(UserProfile.id, VendorProfile.balance, SupplierProfile.balance)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .outerjoin(SupplierProfile, SupplierProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = user_result.scalar_one_or_none()
-        if not user_profile:
+        balance_row = result.first()
+        if not balance_row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get balance from vendor or supplier profile
+        _, vendor_balance, supplier_balance = balance_row
         balance = 0.0
-        if current_user["role"] == "vendor":
-            vendor_result = await db.execute(
-                select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
-            )
-            vendor_profile = vendor_result.scalar_one_or_none()
-            if vendor_profile:
-                balance = vendor_profile.balance
-        elif current_user["role"] == "supplier":
-            supplier_result = await db.execute(
-                select(SupplierProfile).where(SupplierProfile.user_profile_id == user_profile.id)
-            )
-            supplier_profile = supplier_result.scalar_one_or_none()
-            if supplier_profile:
-                balance = supplier_profile.balance
+        if current_user["role"] == "vendor" and vendor_balance is not None:
+            balance = vendor_balance
+        elif current_user["role"] == "supplier" and supplier_balance is not None:
+            balance = supplier_balance
         
         return BalanceResponse(balance=balance)
         
@@ -212,36 +206,44 @@ async def verify_payment(
                 detail="Invalid payment signature"
             )
         
-        # Update payment record
-        payment.razorpay_payment_id = verification_data.razorpay_payment_id
-        payment.razorpay_signature = verification_data.razorpay_signature
-        payment.status = "completed"
-        
-        # Add balance to user account
-        if current_user["role"] == "vendor":
-            vendor_result = await db.execute(
-                select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
+        # Claim the payment atomically: a concurrent verification of the same order
+        # matches no row here, and the unique index on razorpay_payment_id rejects
+        # the same Razorpay payment being applied to a second record.
+        claim_result = await db.execute(
+            update(Payment)
+            .where(Payment.id == payment.id, Payment.status == "pending")
+            .values(
+                razorpay_payment_id=verification_data.razorpay_payment_id,
+                razorpay_signature=verification_data.razorpay_signature,
+                status="completed"
+            )
+            .returning(Payment.id)
+            .execution_options(synchronize_session=False)
+        )
+        if claim_result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Payment already processed"
             )
-            vendor_profile = vendor_result.scalar_one_or_none()
-            if vendor_profile:
-                vendor_profile.balance += payment.amount
-        elif current_user["role"] == "supplier":
-            supplier_result = await db.execute(
-                select(SupplierProfile).where(SupplierProfile.user_profile_id == user_profile.id)
+        
+        # Credit the balance in SQL so concurrent verifications for the same user
+        # both land; a read-modify-write in Python would lose one of them
+        new_balance = 0.0
+        profile_model = {"vendor": VendorProfile, "supplier": SupplierProfile}.get(current_user["role"])
+        if profile_model is not None:
+            credit_result = await db.execute(
+                update(profile_model)
+                .where(profile_model.user_profile_id == user_profile.id)
+                .values(balance=profile_model.balance + payment.amount)
+                .returning(profile_model.balance)
+                .execution_options(synchronize_session=False)
             )
-            supplier_profile = supplier_result.scalar_one_or_none()
-            if supplier_profile:
-                supplier_profile.balance += payment.amount
+            credited_balance = credit_result.scalar_one_or_none()
+            if credited_balance is not None:
+                new_balance = credited_balance
         
         await db.commit()
         
-        # Get updated balance
-        new_balance = 0.0
-        if current_user["role"] == "vendor" and vendor_profile:
-            new_balance = vendor_profile.balance
-        elif current_user["role"] == "supplier" and supplier_profile:
-            new_balance = supplier_profile.balance
-        
         return PaymentVerificationResponse(
             message="Payment verified successfully",
             amount_added=payment.amount,
@@ -251,6 +253,12 @@ async def verify_payment(
         
     except HTTPException:
         raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Payment already processed"
+        )
     except Exception as e:
         logger.error(f"Error verifying payment: {str(e)}")
         await db.rollback()
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, BackgroundTasks, Response
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, or_
+from sqlalchemy import select, insert, and_, func, or_, literal_column
+from sqlalchemy.orm import selectinload
 from config import get_db
 from models import UserProfile, SupplierProfile, Product, BulkPricingTier, Category
 from routers.auth.auth import get_current_user
@@ -31,33 +32,37 @@ security = HTTPBearer()
 
 @router.get("/categories", response_model=List[CategoryWithChildrenResponse])
 async def get_active_categories(
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
     """Get all active categories for product creation"""
     try:
-        # Get root categories
+        # Public and admin-edited only: let browsers/CDN serve repeats for a few minutes
+        response.headers["Cache-Control"] = "public, max-age=300"
+        
+        # Get all active categories in one query and group children by parent
         result = await db.execute(
             select(Category)
-            .where(Category.parent_id.is_(None))
             .where(Category.is_active == True)
             .order_by(Category.name)
         )
-        root_categories = result.scalars().all()
+        active_categories = result.scalars().all()
+        
+        root_categories = []
+        children_by_parent = {}
+        for category in active_categories:
+            if category.parent_id is None:
+                root_categories.append(category)
+            else:
+                children_by_parent.setdefault(category.parent_id, []).append(category)
         
-        # Get children for each category
         categories_with_children = []
         for category in root_categories:
-            # Get children
-            children_result = await db.execute(
-                select(Category)
-                .where(Category.parent_id == category.id)
-                .where(Category.is_active == True)
-                .order_by(Category.name)
-            )
-            children = children_result.scalars().all()
-            
             # Convert children to response models using safe validation
-            children_responses = [safe_model_validate(CategoryResponse, child) for child in children]
+            children_responses = [
+                safe_model_validate(CategoryResponse, child)
+                for child in children_by_parent.get(category.id, [])
+            ]
             
             # Create category response with proper string conversion
             category_dict = category_to_dict(category)
@@ -105,7 +110,9 @@ async def get_products_by_category(
             SupplierProfile, Product.supplier_profile_id == SupplierProfile.id
         ).join(
             UserProfile, SupplierProfile.user_profile_id == UserProfile.id
-        ).where(Product.category_id == category_id)
+        ).where(Product.category_id == category_id).options(
+            selectinload(Product.bulk_pricing_tiers)
+        )
         
         # Apply filters
         if is_active:
@@ -141,18 +148,10 @@ async def get_products_by_category(
         # Build response
         products_with_pricing = []
         for product, category, supplier_profile, user_profile in products_data:
-            # Get pricing tiers
-            pricing_result = await db.execute(
-                select(BulkPricingTier)
-                .where(BulkPricingTier.product_id == product.id)
-                .order_by(BulkPricingTier.min_quantity)
-            )
-            pricing_tiers = pricing_result.scalars().all()
-            
             # Convert using safe validation
             product_dict = safe_model_validate(ProductResponse, product).__dict__.copy()
             product_dict['bulk_pricing_tiers'] = [
-                safe_model_validate(BulkPricingTierResponse, tier) for tier in pricing_tiers
+                safe_model_validate(BulkPricingTierResponse, tier) for tier in product.bulk_pricing_tiers
             ]
             product_dict['category'] = safe_model_validate(CategoryResponse, category)
             product_dict['supplier_name'] = user_profile.display_name or f"{user_profile.first_name} {user_profile.last_name}".strip()
@@ -195,23 +194,21 @@ async def create_product(
                 detail="Only suppliers can create products"
             )
         
-        # Get user profile
+        # Get user profile together with its supplier profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, SupplierProfile)
+            .outerjoin(SupplierProfile, SupplierProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get supplier profile
-        result = await db.execute(
-            select(SupplierProfile).where(SupplierProfile.user_profile_id == user_profile.id)
-        )
-        supplier_profile = result.scalar_one_or_none()
+        user_profile, supplier_profile = profile_data
         
         if not supplier_profile:
             raise HTTPException(
@@ -241,13 +238,15 @@ async def create_product(
         db.add(product)
         await db.flush()  # Get the product ID
         
-        # Create bulk pricing tiers
-        for tier_data in product_data.bulk_pricing_tiers:
-            pricing_tier = BulkPricingTier(
-                product_id=product.id,
-                **tier_data.model_dump()
+        # Create bulk pricing tiers in one multi-row INSERT
+        if product_data.bulk_pricing_tiers:
+            await db.execute(
+                insert(BulkPricingTier),
+                [
+                    {"product_id": product.id, **tier_data.model_dump()}
+                    for tier_data in product_data.bulk_pricing_tiers
+                ]
             )
-            db.add(pricing_tier)
         
         await db.commit()
         await db.refresh(product)
@@ -325,7 +324,9 @@ async def get_my_products(
         # Build query
         query = select(Product, Category).join(
             Category, Product.category_id == Category.id
-        ).where(Product.supplier_profile_id == supplier_profile.id)
+        ).where(Product.supplier_profile_id == supplier_profile.id).options(
+            selectinload(Product.bulk_pricing_tiers)
+        )
         
         # Apply filters
         if category_id:
@@ -356,17 +357,9 @@ async def get_my_products(
         # Build response
         products_with_pricing = []
         for product, category in products_data:
-            # Get pricing tiers
-            result = await db.execute(
-                select(BulkPricingTier)
-                .where(BulkPricingTier.product_id == product.id)
-                .order_by(BulkPricingTier.min_quantity)
-            )
-            pricing_tiers = result.scalars().all()
-            
             product_dict = product.__dict__.copy()
             product_dict['bulk_pricing_tiers'] = [
-                BulkPricingTierResponse.model_validate(tier) for tier in pricing_tiers
+                BulkPricingTierResponse.model_validate(tier) for tier in product.bulk_pricing_tiers
             ]
             product_dict['category'] = CategoryResponse.model_validate(category)
             
@@ -402,6 +395,7 @@ async def get_product(
             .join(Category, Product.category_id == Category.id)
             .where(Product.id == product_id)
             .where(Product.is_active == True)
+            .options(selectinload(Product.bulk_pricing_tiers))
         )
         product_data = result.first()
         
@@ -413,18 +407,10 @@ async def get_product(
         
         product, category = product_data
         
-        # Get pricing tiers
-        result = await db.execute(
-            select(BulkPricingTier)
-            .where(BulkPricingTier.product_id == product.id)
-            .order_by(BulkPricingTier.min_quantity)
-        )
-        pricing_tiers = result.scalars().all()
-        
         # Build response
         product_dict = product.__dict__.copy()
         product_dict['bulk_pricing_tiers'] = [
-            BulkPricingTierResponse.model_validate(tier) for tier in pricing_tiers
+            BulkPricingTierResponse.model_validate(tier) for tier in product.bulk_pricing_tiers
         ]
         product_dict['category'] = CategoryResponse.model_validate(category)
         
@@ -680,10 +666,9 @@ async def upload_product_image(
                 await user_helpers.delete_profile_image(product.primary_image_url)
             product.primary_image_url = image_url
         else:
-            # Add to additional images
-            if not product.additional_images:
-                product.additional_images = []
-            product.additional_images.append(image_url)
+            # Append server-side: an in-place list.append() isn't change-tracked,
+            # and array_append on the row can't lose a concurrent upload
+            product.additional_images = func.array_append(Product.additional_images, image_url)
         
         product.updated_at = datetime.utcnow()
         await db.commit()
@@ -961,6 +946,7 @@ async def list_products(
     search: Optional[str] = Query(None),
     min_price: Optional[float] = Query(None, ge=0),
     max_price: Optional[float] = Query(None, ge=0),
+    color: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
     """List all active products with filtering"""
@@ -968,7 +954,9 @@ async def list_products(
         # Build base query
         query = select(Product, Category).join(
             Category, Product.category_id == Category.id
-        ).where(Product.is_active == True)
+        ).where(Product.is_active == True).options(
+            selectinload(Product.bulk_pricing_tiers)
+        )
         
         # Apply filters
         if category_id:
@@ -987,6 +975,12 @@ async def list_products(
                 )
             )
         
+        if color:
+            # Literal key so the expression matches ix_products_spec_color
+            query = query.where(
+                Product.specifications.op("->>")(literal_column("'color'")) == color
+            )
+        
         # Price filtering requires joining with pricing tiers
         if min_price is not None or max_price is not None:
             # Subquery to get minimum price for each product
@@ -1008,6 +1002,10 @@ async def list_products(
             count_query = count_query.where(Product.category_id == category_id)
         if supplier_id:
             count_query = count_query.where(Product.supplier_profile_id == supplier_id)
+        if color:
+            count_query = count_query.where(
+                Product.specifications.op("->>")(literal_column("'color'")) == color
+            )
         
         total_result = await db.execute(count_query)
         total = total_result.scalar()
@@ -1022,17 +1020,9 @@ async def list_products(
         # Build response
         products_with_pricing = []
         for product, category in products_data:
-            # Get pricing tiers
-            result = await db.execute(
-                select(BulkPricingTier)
-                .where(BulkPricingTier.product_id == product.id)
-                .order_by(BulkPricingTier.min_quantity)
-            )
-            pricing_tiers = result.scalars().all()
-            
             product_dict = product.__dict__.copy()
             product_dict['bulk_pricing_tiers'] = [
-                BulkPricingTierResponse.model_validate(tier) for tier in pricing_tiers
+                BulkPricingTierResponse.model_validate(tier) for tier in product.bulk_pricing_tiers
             ]
             product_dict['category'] = CategoryResponse.model_validate(category)
             
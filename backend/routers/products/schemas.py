@@ -46,7 +46,9 @@ class CategoryListResponse(BaseModel):
     categories: List[CategoryWithChildrenResponse]
     page: int
     limit: int
-    total: int
+    # Omitted in cursor mode, where counting every row would defeat the seek
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # Bulk Pricing Tier Schemas
@@ -118,32 +118,23 @@ async def get_my_supplier_orders(
     try:
         # Get orders where seller_id matches current_user's profile id
         result = await db.execute(
-            select(Order).where(Order.seller_id == current_user["user_id"])
+            select(Order, Product.name, UserProfile.first_name, UserProfile.last_name)
+            .outerjoin(Product, Order.product_id == Product.id)
+            .outerjoin(UserProfile, Order.buyer_id == UserProfile.id)
+            .where(Order.seller_id == current_user["user_id"])
             .order_by(Order.created_at.desc())
         )
-        orders = result.scalars().all()
+        orders = result.all()
         
         # Convert to response format
         order_responses = []
-        for order in orders:
-            # Get product details
-            product_result = await db.execute(
-                select(Product).where(Product.id == order.product_id)
-            )
-            product = product_result.scalar_one_or_none()
-            
-            # Get buyer details
-            buyer_result = await db.execute(
-                select(UserProfile).where(UserProfile.id == order.buyer_id)
-            )
-            buyer = buyer_result.scalar_one_or_none()
-            
+        for order, product_name, buyer_first_name, buyer_last_name in orders:
             order_data = {
                 "id": str(order.id),
                 "buyer_id": str(order.buyer_id),
-                "buyer_name": f"{buyer.first_name or ''} {buyer.last_name or ''}".strip() if buyer else "Unknown",
+                "buyer_name": f"{buyer_first_name or ''} {buyer_last_name or ''}".strip() or "Unknown",
                 "product_id": str(order.product_id),
-                "product_name": product.name if product else "Unknown Product",
+                "product_name": product_name or "Unknown Product",
                 "quantity": order.quantity,
                 "price_per_unit": order.price_per_unit,
                 "total_amount": order.total_amount,
@@ -98,7 +98,9 @@ class UserListResponse(BaseModel):
     users: list[UserListItem]
     page: int
     limit: int
-    total: int
+    # Omitted in cursor mode, where counting every row would defeat the seek
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # Vendor Profile Schemas
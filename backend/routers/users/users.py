@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, or_
+from sqlalchemy import select, and_, func, or_, cast, bindparam
+from geoalchemy2 import Geography
 from config import get_db, get_supabase_admin_client
 from models import UserProfile, VendorProfile, SupplierProfile, Review
 from routers.auth.auth import get_current_user
@@ -12,7 +13,7 @@ from .schemas import (
     VendorProfileCreate, VendorProfileUpdate, VendorProfileResponse,
     SupplierProfileCreate, SupplierProfileUpdate, SupplierProfileResponse,
     ReviewCreate, ReviewUpdate, ReviewResponse, ReviewWithUserResponse,
-    VendorWithUserResponse, SupplierWithUserResponse, SupplierListResponse,
+    VendorWithUserResponse, SupplierWithUserResponse, SupplierListResponse, VendorListResponse,
 )
 from .helpers import user_helpers
 from typing import Optional, List
@@ -28,6 +29,22 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 security = HTTPBearer()
 
+# Public review list, built once so its cache key is memoized across requests
+REVIEWS_FOR_USER = (
+    select(
+        Review,
+        UserProfile.display_name,
+        UserProfile.first_name,
+        UserProfile.avatar_url
+    )
+    .join(UserProfile, Review.reviewer_user_id == UserProfile.id)
+    .where(Review.reviewed_user_id == bindparam("user_id"))
+    .where(Review.is_hidden == False)
+    .order_by(Review.created_at.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
     current_user = Depends(get_current_user),
@@ -82,9 +99,9 @@ async def update_current_user_profile(
         
         if profile_update.username and profile_update.username != profile.username:
             result = await db.execute(
-                select(UserProfile).where(
+                select(UserProfile.id).where(
                     and_(
-                        UserProfile.username == profile_update.username,
+                        func.lower(UserProfile.username) == profile_update.username.lower(),
                         UserProfile.id != profile.id
                     )
                 )
@@ -254,23 +271,21 @@ async def create_vendor_profile(
                 detail="Only users with vendor role can create vendor profiles"
             )
         
-        # Get user profile
+        # Get user profile together with its vendor profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, VendorProfile)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Check if vendor profile already exists
-        result = await db.execute(
-            select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
-        )
-        existing_vendor = result.scalar_one_or_none()
+        user_profile, existing_vendor = profile_data
         
         if existing_vendor:
             raise HTTPException(
@@ -308,23 +323,21 @@ async def get_my_vendor_profile(
 ):
     """Get current user's vendor profile"""
     try:
-        # Get user profile
+        # Get user profile together with its vendor profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, VendorProfile)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get vendor profile
-        result = await db.execute(
-            select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
-        )
-        vendor_profile = result.scalar_one_or_none()
+        user_profile, vendor_profile = profile_data
         
         if not vendor_profile:
             raise HTTPException(
@@ -352,23 +365,21 @@ async def update_my_vendor_profile(
 ):
     """Update current user's vendor profile"""
     try:
-        # Get user profile
+        # Get user profile together with its vendor profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, VendorProfile)
+            .outerjoin(VendorProfile, VendorProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get vendor profile
-        result = await db.execute(
-            select(VendorProfile).where(VendorProfile.user_profile_id == user_profile.id)
-        )
-        vendor_profile = result.scalar_one_or_none()
+        user_profile, vendor_profile = profile_data
         
         if not vendor_profile:
             raise HTTPException(
@@ -438,6 +449,62 @@ async def get_vendor_details(
         )
 
 
+@router.get("/vendors/nearby", response_model=VendorListResponse)
+async def get_nearby_vendors(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(5, gt=0, le=100),
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get active vendors within radius_km of a point"""
+    try:
+        # ST_DWithin on geography is index-assisted by ix_vendor_location_gist
+        point = cast(
+            func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326),
+            Geography(geometry_type="POINT", srid=4326)
+        )
+        query = select(VendorProfile, UserProfile).join(
+            UserProfile, VendorProfile.user_profile_id == UserProfile.id
+        ).where(
+            VendorProfile.is_active == True,
+            func.ST_DWithin(VendorProfile.location, point, radius_km * 1000)
+        )
+        
+        # Get total count
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar()
+        
+        # Apply pagination, nearest first; <-> on geography is a KNN scan on the GiST index
+        offset = (page - 1) * limit
+        query = query.order_by(VendorProfile.location.op("<->")(point))
+        result = await db.execute(query.offset(offset).limit(limit))
+        
+        vendors = [
+            VendorWithUserResponse(
+                user_profile=user_profile,
+                vendor_profile=vendor_profile
+            )
+            for vendor_profile, user_profile in result.all()
+        ]
+        
+        return VendorListResponse(
+            vendors=vendors,
+            page=page,
+            limit=limit,
+            total=total
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting nearby vendors: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get nearby vendors"
+        )
+
+
 # =================
 # SUPPLIER ROUTES
 # =================
@@ -457,23 +524,21 @@ async def create_supplier_profile(
                 detail="Only users with supplier role can create supplier profiles"
             )
         
-        # Get user profile
+        # Get user profile together with its supplier profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, SupplierProfile)
+            .outerjoin(SupplierProfile, SupplierProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Check if supplier profile already exists
-        result = await db.execute(
-            select(SupplierProfile).where(SupplierProfile.user_profile_id == user_profile.id)
-        )
-        existing_supplier = result.scalar_one_or_none()
+        user_profile, existing_supplier = profile_data
         
         if existing_supplier:
             raise HTTPException(
@@ -511,23 +576,21 @@ async def get_my_supplier_profile(
 ):
     """Get current user's supplier profile"""
     try:
-        # Get user profile
+        # Get user profile together with its supplier profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, SupplierProfile)
+            .outerjoin(SupplierProfile, SupplierProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get supplier profile
-        result = await db.execute(
-            select(SupplierProfile).where(SupplierProfile.user_profile_id == user_profile.id)
-        )
-        supplier_profile = result.scalar_one_or_none()
+        user_profile, supplier_profile = profile_data
         
         if not supplier_profile:
             raise HTTPException(
@@ -555,23 +618,21 @@ async def update_my_supplier_profile(
 ):
     """Update current user's supplier profile"""
     try:
-        # Get user profile
+        # Get user profile together with its supplier profile (if any)
         result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == current_user["user_id"])
+            select(UserProfile, SupplierProfile)
+            .outerjoin(SupplierProfile, SupplierProfile.user_profile_id == UserProfile.id)
+            .where(UserProfile.user_id == current_user["user_id"])
         )
-        user_profile = result.scalar_one_or_none()
+        profile_data = result.first()
         
-        if not user_profile:
+        if not profile_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
         
-        # Get supplier profile
-        result = await db.execute(
-            select(SupplierProfile).where(SupplierProfile.user_profile_id == user_profile.id)
-        )
-        supplier_profile = result.scalar_one_or_none()
+        user_profile, supplier_profile = profile_data
         
         if not supplier_profile:
             raise HTTPException(
@@ -745,12 +806,13 @@ async def create_review(
                 detail="User to review not found"
             )
         
-        # Check if review already exists
+        # Check if review already exists for this transaction (or without one)
         result = await db.execute(
-            select(Review).where(
+            select(Review.id).where(
                 and_(
                     Review.reviewer_user_id == reviewer_profile.id,
-                    Review.reviewed_user_id == review_data.reviewed_user_id
+                    Review.reviewed_user_id == review_data.reviewed_user_id,
+                    Review.transaction_id.is_not_distinct_from(review_data.transaction_id)
                 )
             )
         )
@@ -759,7 +821,8 @@ async def create_review(
         if existing_review:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You have already reviewed this user"
+                detail="You have already reviewed this user for this transaction"
+                if review_data.transaction_id else "You have already reviewed this user"
             )
         
         # Create review
@@ -772,10 +835,6 @@ async def create_review(
         await db.commit()
         await db.refresh(review)
         
-        # Update ratings
-        await user_helpers.update_vendor_rating(review_data.reviewed_user_id, db)
-        await user_helpers.update_supplier_rating(review_data.reviewed_user_id, db)
-        
         return safe_model_validate(ReviewResponse, review)
         
     except HTTPException:
@@ -839,11 +898,6 @@ async def update_review(
         await db.commit()
         await db.refresh(review)
         
-        # Update ratings if rating changed
-        if "rating" in update_data:
-            await user_helpers.update_vendor_rating(str(review.reviewed_user_id), db)
-            await user_helpers.update_supplier_rating(str(review.reviewed_user_id), db)
-        
         return safe_model_validate(ReviewResponse, review)
         
     except HTTPException:
@@ -870,22 +924,17 @@ async def get_user_reviews(
         
         # Get reviews with reviewer information
         result = await db.execute(
-            select(Review, UserProfile)
-            .join(UserProfile, Review.reviewer_user_id == UserProfile.id)
-            .where(Review.reviewed_user_id == user_id)
-            .where(Review.is_hidden == False)
-            .order_by(Review.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+            REVIEWS_FOR_USER,
+            {"user_id": user_id, "offset": offset, "limit": limit}
         )
         reviews_data = result.all()
         
         reviews = []
-        for review, reviewer_profile in reviews_data:
+        for review, display_name, first_name, avatar_url in reviews_data:
             review_dict = review_to_dict(review)
             review_dict.update({
-                "reviewer_name": reviewer_profile.display_name or reviewer_profile.first_name,
-                "reviewer_avatar": reviewer_profile.avatar_url
+                "reviewer_name": display_name or first_name,
+                "reviewer_avatar": avatar_url
             })
             reviews.append(safe_model_validate(ReviewWithUserResponse, review_dict))
         
@@ -938,16 +987,10 @@ async def delete_review(
                 detail="You can only delete your own reviews"
             )
         
-        reviewed_user_id = str(review.reviewed_user_id)
-        
         # Delete review
         await db.delete(review)
         await db.commit()
         
-        # Update ratings
-        await user_helpers.update_vendor_rating(reviewed_user_id, db)
-        await user_helpers.update_supplier_rating(reviewed_user_id, db)
-        
         return {"message": "Review deleted successfully"}
         
     except HTTPException:
@@ -0,0 +1,43 @@
+"""
+Apply Alembic migrations out-of-band
+
+Run from CI/CD before traffic is shifted to a new deployment:
+
+    python scripts/migrate.py            # upgrade to head
+    python scripts/migrate.py <revision> # upgrade to a specific revision
+
+Migrations never run on Lambda cold start. For local development the API can
+apply them in-process at import time with MIGRATION_MODE=sync (see main.py).
+"""
+import os
+import sys
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_alembic_config() -> Config:
+    """Alembic config for the migrations/ chain, with or without an alembic.ini"""
+    ini_path = os.path.join(BACKEND_DIR, "alembic.ini")
+    config = Config(ini_path) if os.path.exists(ini_path) else Config()
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    return config
+
+
+def get_head_revision() -> str:
+    """Revision id of the newest migration shipped with this build"""
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+def upgrade(revision: str = "head") -> None:
+    # migrations/env.py imports config and models from the backend directory
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+    command.upgrade(get_alembic_config(), revision)
+
+
+if __name__ == "__main__":
+    upgrade(sys.argv[1] if len(sys.argv) > 1 else "head")
@@ -0,0 +1,22 @@
+"""
+Primary key generation
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562)
+
+    48-bit Unix millisecond timestamp followed by 74 random bits, so new keys
+    land at the right edge of the primary key B-tree instead of a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    # version (0111) in bits 76-79, variant (10) in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
@@ -0,0 +1,23 @@
+"""
+Keyset (cursor) pagination helpers
+"""
+import base64
+import binascii
+
+
+def encode_cursor(value) -> str:
+    """Encode the last row's sort key as an opaque URL-safe cursor"""
+    return base64.urlsafe_b64encode(str(value).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises ValueError if the cursor is not valid base64 text.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded.encode(), altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e